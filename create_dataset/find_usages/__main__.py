@@ -1,10 +1,12 @@
 # import argparse
 import builtins
 import collections
+import concurrent.futures
 import importlib
 import itertools
 import json
 import logging
+import multiprocessing
 import os
 import os.path
 import sys
@@ -13,17 +15,166 @@ import typing
 import argparse
 
 from ast import AST
-from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 from ast_node_namespace_trie import get_ast_node_namespace_trie, search_ast_node_namespace_trie
 from get_definitions_to_runtime_terms_mappings import get_definitions_to_runtime_terms_mappings
 from get_module_names_to_imported_names_to_runtime_objects import get_module_names_to_imported_names_to_runtime_objects
-from get_use_define_mapping import get_use_define_mapping
-from modified_handle_local_syntax_directed_typing_constraints import modified_handle_local_syntax_directed_typing_constraints
+from get_use_define_mapping import get_incremental_use_define_mapping
+from modified_handle_local_syntax_directed_typing_constraints import get_local_syntax_directed_typing_constraints_callback
+from scoped_evaluation_order_node_visitor import NodeProvidingScope, scoped_evaluation_order_node_visitor
 from static_import_analysis import do_static_import_analysis
 from trie import search
 from type_definitions import *
-from unwrap import unwrap
+from unwrap import cached_unwrap, unwrap
+
+
+EMPTY_RUNTIME_TERMS: frozenset[RuntimeTerm] = frozenset()
+
+ENTRYPOINT_SCRIPT_FILE_NAMES: frozenset[str] = frozenset({'setup.py', '__main__.py'})
+
+
+class SharedContext(NamedTuple):
+    """Read-only, cross-module information needed to handle each module."""
+    module_name_to_module: Mapping[str, Module]
+    module_names_to_imported_names_to_runtime_objects: Mapping[str, Mapping[str, object]]
+    top_level_class_definitions_to_runtime_classes: Mapping[ast.ClassDef, RuntimeClass]
+    unwrapped_runtime_functions_to_named_function_definitions: Mapping[UnwrappedRuntimeFunction, FunctionDefinition]
+    named_function_definitions_to_unwrapped_runtime_functions: Mapping[FunctionDefinition, UnwrappedRuntimeFunction]
+    builtin_names_to_dummy_definition_nodes: Mapping[str, ast.AST]
+    builtin_dummy_definition_nodes_to_runtime_terms: Mapping[ast.AST, typing.AbstractSet[RuntimeTerm]]
+
+
+def process_module(
+    module_name: str,
+    module_node: ast.Module,
+    shared_context: SharedContext
+) -> str:
+    """
+    Find the calls within a module, returning the CSV lines describing them.
+    Modules are independent of each other, given the shared context.
+    """
+    (
+        module_name_to_module,
+        module_names_to_imported_names_to_runtime_objects,
+        top_level_class_definitions_to_runtime_classes,
+        unwrapped_runtime_functions_to_named_function_definitions,
+        named_function_definitions_to_unwrapped_runtime_functions,
+        builtin_names_to_dummy_definition_nodes,
+        builtin_dummy_definition_nodes_to_runtime_terms
+    ) = shared_context
+
+    # STATEFUL SECTION
+
+    # Start from fresh copies of the runtime terms of the shared builtin dummy definition nodes,
+    # so that a module shadowing a builtin does not leak runtime terms into other modules
+    node_runtime_terms = collections.defaultdict(set, {
+        dummy_definition_node: set(runtime_terms)
+        for dummy_definition_node, runtime_terms in builtin_dummy_definition_nodes_to_runtime_terms.items()
+    })
+
+    def get_runtime_terms(node_: ast.AST):
+        # Do not insert empty entries on reads
+        return node_runtime_terms.get(node_, EMPTY_RUNTIME_TERMS)
+
+    def update_runtime_terms(node_: ast.AST, runtime_terms: typing.Iterable[RuntimeTerm]):
+        node_runtime_terms[node_].update(runtime_terms)
+
+    # Initialize dummy definition nodes with builtins and imports
+    names_to_dummy_definition_nodes = dict(builtin_names_to_dummy_definition_nodes)
+
+    imported_names_to_runtime_objects = module_names_to_imported_names_to_runtime_objects.get(module_name, {})
+    for imported_name, runtime_object in imported_names_to_runtime_objects.items():
+        unwrapped_runtime_object = cached_unwrap(runtime_object)
+        runtime_term: typing.Optional[RuntimeTerm] = None
+
+        if isinstance(unwrapped_runtime_object, Module):
+            runtime_term = unwrapped_runtime_object
+        elif isinstance(unwrapped_runtime_object, RuntimeClass):
+            runtime_term = unwrapped_runtime_object
+        elif isinstance(unwrapped_runtime_object, UnwrappedRuntimeFunction):
+            processed_unwrapped_runtime_object = runtime_term_of_unwrapped_runtime_function(unwrapped_runtime_object)
+
+            runtime_term = unwrapped_runtime_functions_to_named_function_definitions.get(
+                processed_unwrapped_runtime_object,
+                processed_unwrapped_runtime_object
+            )
+        
+        if runtime_term is not None:
+            dummy_definition_node = ast.AST()
+            setattr(dummy_definition_node, 'id', imported_name)
+
+            names_to_dummy_definition_nodes[imported_name] = dummy_definition_node
+            update_runtime_terms(dummy_definition_node, {runtime_term})
+        else:
+            logging.error(
+                'Cannot match imported name %s in module %s with unwrapped runtime object %s to a runtime term!',
+                imported_name, module_name, unwrapped_runtime_object
+            )
+
+    
+    # Add dummy nodes for all classes defined within the file
+    for key, value in module_name_to_module[module_name].__dict__.items():
+        name = key
+        unwrapped_value = cached_unwrap(value)
+        if isinstance(unwrapped_value, type) and unwrapped_value.__module__ == module_name:
+            dummy_definition_node = ast.AST()
+            setattr(dummy_definition_node, 'id', name)
+
+            names_to_dummy_definition_nodes[name] = dummy_definition_node
+
+            update_runtime_terms(dummy_definition_node, {unwrapped_value})
+    
+    
+    def merge_runtime_terms(
+        target_set_top_element: ast.AST,
+        target_set: set[ast.AST],
+        acquirer_set_top_element: ast.AST,
+        acquirer_set: set[ast.AST]
+    ):
+        # The definition node of the target set's nodes becomes the acquirer set's top element
+        if target_set_top_element in node_runtime_terms:
+            update_runtime_terms(acquirer_set_top_element, node_runtime_terms[target_set_top_element])
+
+    output_lines = []
+
+    # Build the use-define mapping and handle typing constraints in a single pass over the module
+    use_define_mapping, name_resolution_callback = get_incremental_use_define_mapping(
+        names_to_dummy_definition_nodes,
+        merge_runtime_terms
+    )
+
+    typing_constraints_callback = get_local_syntax_directed_typing_constraints_callback(
+        module_name,
+        top_level_class_definitions_to_runtime_classes,
+        unwrapped_runtime_functions_to_named_function_definitions,
+        named_function_definitions_to_unwrapped_runtime_functions,
+        use_define_mapping,
+        get_runtime_terms,
+        update_runtime_terms,
+        output_lines,
+    )
+
+    def callback(node: ast.AST, scope_stack: typing.Sequence[NodeProvidingScope]):
+        name_resolution_callback(node, scope_stack)
+        typing_constraints_callback(node, scope_stack)
+
+    scoped_evaluation_order_node_visitor(module_node, callback)
+
+    return ''.join(output_lines)
+
+
+# Set in the parent process before forking worker processes, which inherit it instead of unpickling it
+worker_shared_context: Optional[SharedContext] = None
+worker_module_name_to_module_node: Mapping[str, ast.Module] = {}
+
+
+def process_module_in_worker(module_name: str) -> str:
+    return process_module(
+        module_name,
+        worker_module_name_to_module_node[module_name],
+        worker_shared_context
+    )
 
 
 if __name__ == '__main__':
@@ -41,6 +192,7 @@ if __name__ == '__main__':
     # Parse command-line arguments
     parser = argparse.ArgumentParser()
     parser.add_argument('-s', '--module-search-path', type=str, required=True, help='Module search path')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='Number of worker processes handling modules')
     args = parser.parse_args()
 
     # Search modules
@@ -62,17 +214,23 @@ if __name__ == '__main__':
 
     sys.path.insert(0, module_search_absolute_path)
 
-    for module_name, file_path in module_name_to_file_path_dict.items():
-        if file_path.endswith('setup.py') or file_path.endswith('__main__.py'):
-            continue
+    # Skip entrypoint scripts, which should not be imported
+    importable_module_name_to_file_path_dict = {
+        module_name: file_path
+        for module_name, file_path in module_name_to_file_path_dict.items()
+        if os.path.basename(file_path) not in ENTRYPOINT_SCRIPT_FILE_NAMES
+    }
+
+    for module_name, file_path in importable_module_name_to_file_path_dict.items():
         try:
-            with open(file_path, 'r') as fp:
+            # Let the parser detect the source encoding (PEP 263) instead of decoding through the text layer
+            with open(file_path, 'rb') as fp:
                 code = fp.read()
-                module_node = ast.parse(code)
+            module_node = ast.parse(code, filename=file_path)
             module = importlib.import_module(module_name)
             module_name_to_module_node[module_name] = module_node
             module_name_to_module[module_name] = module
-        except (ImportError, UnicodeError):
+        except (ImportError, SyntaxError, UnicodeError):
             logging.exception('Failed to import module %s', module_name)
 
     module_names = list(module_name_to_module_node.keys())
@@ -101,106 +259,60 @@ if __name__ == '__main__':
         in unwrapped_runtime_functions_to_named_function_definitions.items()
     }
 
-    # STATEFUL SECTION
-
-    node_runtime_terms = {}
-
-    def get_runtime_terms(node_: ast.AST):
-        return node_runtime_terms.get(node_, set())
-
-    def update_runtime_terms(node_: ast.AST, runtime_terms: typing.Iterable[RuntimeTerm]):
-        node_runtime_terms.setdefault(node_, set()).update(runtime_terms)
-
-    # Handle each module
+    # Build dummy definition nodes for builtins once, as they are identical for every module
+    builtin_names_to_dummy_definition_nodes = {}
+    builtin_dummy_definition_nodes_to_runtime_terms = {}
 
-    for module_name, module_node in module_name_to_module_node.items():
-        # Initialize dummy definition nodes with builtins and imports
-        names_to_dummy_definition_nodes = {}
+    for name, value in vars(builtins).items():
+        if name.startswith('_'):
+            continue
 
-        for key, value in builtins.__dict__.items():
-            name = key
-            unwrapped_value = unwrap(value)
-            if (not name.startswith('_')) and isinstance(unwrapped_value, (RuntimeClass, UnwrappedRuntimeFunction)):
-                dummy_definition_node = ast.AST()
-                setattr(dummy_definition_node, 'id', name)
+        unwrapped_value = unwrap(value)
+        if isinstance(unwrapped_value, RuntimeClass):
+            runtime_term = unwrapped_value
+        elif isinstance(unwrapped_value, UnwrappedRuntimeFunction):
+            runtime_term = runtime_term_of_unwrapped_runtime_function(unwrapped_value)
+        else:
+            continue
 
-                names_to_dummy_definition_nodes[name] = dummy_definition_node
+        dummy_definition_node = ast.AST()
+        setattr(dummy_definition_node, 'id', name)
 
-                if isinstance(unwrapped_value, RuntimeClass):
-                    update_runtime_terms(dummy_definition_node, {unwrapped_value})
-                elif isinstance(unwrapped_value, UnwrappedRuntimeFunction):
-                    update_runtime_terms(dummy_definition_node, {runtime_term_of_unwrapped_runtime_function(unwrapped_value)})
+        builtin_names_to_dummy_definition_nodes[name] = dummy_definition_node
+        builtin_dummy_definition_nodes_to_runtime_terms[dummy_definition_node] = {runtime_term}
 
-        for value in (True, False, Ellipsis, None, NotImplemented):
-            name = str(value)
+    for value in (True, False, Ellipsis, None, NotImplemented):
+        name = str(value)
 
-            dummy_definition_node = ast.AST()
-            setattr(dummy_definition_node, 'id', name)
+        dummy_definition_node = ast.AST()
+        setattr(dummy_definition_node, 'id', name)
 
-            names_to_dummy_definition_nodes[name] = dummy_definition_node
-            update_runtime_terms(dummy_definition_node, {Instance(type(value))})
-
-        imported_names_to_runtime_objects = module_names_to_imported_names_to_runtime_objects.get(module_name, {})
-        for imported_name, runtime_object in imported_names_to_runtime_objects.items():
-            unwrapped_runtime_object = unwrap(runtime_object)
-            runtime_term: typing.Optional[RuntimeTerm] = None
-
-            if isinstance(unwrapped_runtime_object, Module):
-                runtime_term = unwrapped_runtime_object
-            elif isinstance(unwrapped_runtime_object, RuntimeClass):
-                runtime_term = unwrapped_runtime_object
-            elif isinstance(unwrapped_runtime_object, UnwrappedRuntimeFunction):
-                processed_unwrapped_runtime_object = runtime_term_of_unwrapped_runtime_function(unwrapped_runtime_object)
-
-                runtime_term = unwrapped_runtime_functions_to_named_function_definitions.get(
-                    processed_unwrapped_runtime_object,
-                    processed_unwrapped_runtime_object
-                )
-            
-            if runtime_term is not None:
-                dummy_definition_node = ast.AST()
-                setattr(dummy_definition_node, 'id', imported_name)
-
-                names_to_dummy_definition_nodes[imported_name] = dummy_definition_node
-                update_runtime_terms(dummy_definition_node, {runtime_term})
-            else:
-                logging.error(
-                    'Cannot match imported name %s in module %s with unwrapped runtime object %s to a runtime term!',
-                    imported_name, module_name, unwrapped_runtime_object
-                )
+        builtin_names_to_dummy_definition_nodes[name] = dummy_definition_node
+        builtin_dummy_definition_nodes_to_runtime_terms[dummy_definition_node] = {Instance(type(value))}
 
-        
-        # Add dummy nodes for all classes defined within the file
-        for key, value in module_name_to_module[module_name].__dict__.items():
-            name = key
-            unwrapped_value = unwrap(value)
-            if isinstance(unwrapped_value, type) and unwrapped_value.__module__ == module_name:
-                dummy_definition_node = ast.AST()
-                setattr(dummy_definition_node, 'id', name)
+    # Handle each module
 
-                names_to_dummy_definition_nodes[name] = dummy_definition_node
+    shared_context = SharedContext(
+        module_name_to_module,
+        module_names_to_imported_names_to_runtime_objects,
+        top_level_class_definitions_to_runtime_classes,
+        unwrapped_runtime_functions_to_named_function_definitions,
+        named_function_definitions_to_unwrapped_runtime_functions,
+        builtin_names_to_dummy_definition_nodes,
+        builtin_dummy_definition_nodes_to_runtime_terms
+    )
 
-                update_runtime_terms(dummy_definition_node, {unwrapped_value})
-        
-        
-        use_define_mapping = get_use_define_mapping(
-            module_node,
-            names_to_dummy_definition_nodes
-        )
-
-        node_to_definition_node_mapping = {
-            node: definition_node
-            for definition_node, nodes in use_define_mapping.itersets()
-            for node in nodes
-        }
-
-        modified_handle_local_syntax_directed_typing_constraints(
-            module_name,
-            module_node,
-            top_level_class_definitions_to_runtime_classes,
-            unwrapped_runtime_functions_to_named_function_definitions,
-            named_function_definitions_to_unwrapped_runtime_functions,
-            node_to_definition_node_mapping,
-            get_runtime_terms,
-            update_runtime_terms,
-        )
+    if args.jobs is not None and args.jobs > 1:
+        # The shared context holds modules, functions and AST nodes, which are shared with the workers through fork
+        worker_shared_context = shared_context
+        worker_module_name_to_module_node = module_name_to_module_node
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.jobs,
+            mp_context=multiprocessing.get_context('fork')
+        ) as executor:
+            for module_output in executor.map(process_module_in_worker, module_name_to_module_node):
+                sys.stdout.write(module_output)
+    else:
+        for module_name, module_node in module_name_to_module_node.items():
+            sys.stdout.write(process_module(module_name, module_node, shared_context))
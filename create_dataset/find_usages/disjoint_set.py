@@ -47,6 +47,16 @@ class DisjointSet(Generic[T]):
                 self.element_to_parent_element[element] = self.find(self.element_to_parent_element[element])
             return self.element_to_parent_element[element]
 
+    def get(self, element: T, default: Optional[T] = None) -> Optional[T]:
+        """
+        Return the top element of the set containing the given element, or `default` if the element is not present.
+        Unlike `find`, does not add the element.
+        """
+        if element in self.element_to_parent_element:
+            return self.find(element)
+        else:
+            return default
+
     def get_containing_set(self, element: T) -> frozenset[T]:
         """
         Return the set containing the given element.
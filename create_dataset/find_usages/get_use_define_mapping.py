@@ -21,10 +21,18 @@ def get_scope(
     return current_scope_or_none
 
 
-def get_use_define_mapping(
-    module_node: ast.Module,
-    global_names_to_definition_nodes: typing.Mapping[str, ast.AST]
-):
+def get_incremental_use_define_mapping(
+    global_names_to_definition_nodes: typing.Mapping[str, ast.AST],
+    union_callback: typing.Optional[typing.Callable[[ast.AST, set[ast.AST], ast.AST, set[ast.AST]], None]] = None
+) -> tuple[
+    DisjointSet[ast.AST],
+    typing.Callable[[ast.AST, typing.Sequence[NodeProvidingScope]], None]
+]:
+    """
+    Return a use-define mapping together with the `scoped_evaluation_order_node_visitor` callback that builds it.
+    The mapping is up to date for all nodes visited so far, so other callbacks can be run in the same pass.
+    `union_callback` is passed on to `DisjointSet.union` whenever two sets are merged.
+    """
     scope_to_names_to_definition_nodes: dict[
         typing.Optional[NodeProvidingScope],
         typing.Mapping[str, ast.AST]
@@ -94,7 +102,7 @@ def get_use_define_mapping(
             # If is_definition is True, the previous definition node is in fact only valid if is within the current scope.
             # Otherwise, we are shadowing a name from an outer scope.
             if (not is_definition) or (is_definition and previous_definition_scope_or_none == current_scope_or_none):
-                use_define_mapping.union(node, previous_definition_node_or_none)
+                use_define_mapping.union(node, previous_definition_node_or_none, union_callback)
         
         if is_definition:
             set_definition_node(scope_stack, name, node)
@@ -118,7 +126,7 @@ def get_use_define_mapping(
                 set_definition_node(tuple(), name, global_definition_node)
             
             set_definition_node(scope_stack, name, node)
-            use_define_mapping.union(node, global_definition_node)
+            use_define_mapping.union(node, global_definition_node, union_callback)
     
     def handle_nonlocal_node(
         scope_stack: typing.Sequence[NodeProvidingScope],
@@ -132,7 +140,7 @@ def get_use_define_mapping(
 
             if nonlocal_definition_node_or_none is not None:
                 nonlocal_definition_node = nonlocal_definition_node_or_none
-                use_define_mapping.union(node, nonlocal_definition_node)
+                use_define_mapping.union(node, nonlocal_definition_node, union_callback)
             
             set_definition_node(scope_stack, name, node)
 
@@ -171,7 +179,19 @@ def get_use_define_mapping(
     for global_name, definition_node in global_names_to_definition_nodes.items():
         set_definition_node(tuple(), global_name, definition_node)
 
+    return use_define_mapping, module_level_name_resolution_callback
+
+
+def get_use_define_mapping(
+    module_node: ast.Module,
+    global_names_to_definition_nodes: typing.Mapping[str, ast.AST]
+):
+    use_define_mapping, module_level_name_resolution_callback = get_incremental_use_define_mapping(
+        global_names_to_definition_nodes
+    )
+
     # Visit nodes in the module.
     scoped_evaluation_order_node_visitor(module_node, module_level_name_resolution_callback)
 
-    return use_define_mapping 
+    return use_define_mapping
+
@@ -1,16 +1,18 @@
 import ast
 import collections
 import collections.abc
-import itertools
+import functools
 
 import inspect
+import sys
+import typing
 
 from typing import Any, Callable, Iterable, Mapping, Optional
 
 from get_attribute_access_result import get_attribute_access_result
 from get_comprehensive_dict_for_runtime_class import get_comprehensive_dict_for_runtime_class
 from get_unwrapped_constructor import get_unwrapped_constructor
-from scoped_evaluation_order_node_visitor import NodeProvidingScope, scoped_evaluation_order_node_visitor
+from scoped_evaluation_order_node_visitor import NAMED_NODE_PROVIDING_SCOPE_TYPES, NodeProvidingScope, scoped_evaluation_order_node_visitor
 from type_definitions import (
     RuntimeClass,
     UnwrappedRuntimeFunction,
@@ -24,16 +26,55 @@ from type_definitions import (
 from unwrap import unwrap
 
 
-def modified_handle_local_syntax_directed_typing_constraints(
+# (callee_module_name, callee_class_name, callee_function_name, callee_function)
+CalleeInformation = tuple[str, str, str, UnwrappedRuntimeFunction]
+
+
+# The same callee is reached from many call sites, so cache the (expensive) source and signature lookups per callee.
+@functools.lru_cache(maxsize=None)
+def get_source_line_range(function: UnwrappedRuntimeFunction) -> tuple[int, int]:
+    source_lines, start_line = inspect.getsourcelines(function)
+    end_line = start_line + len(source_lines) - 1
+    return start_line, end_line
+
+
+@functools.lru_cache(maxsize=None)
+def get_signature_string(function: UnwrappedRuntimeFunction) -> str:
+    return str(inspect.signature(function))
+
+
+# Many Instance terms share a class, so cache the class's unwrapped `__call__` (or None) instead of rebuilding its comprehensive dict per call site.
+@functools.lru_cache(maxsize=None)
+def get_unwrapped_call_of_runtime_class(runtime_class: RuntimeClass) -> Optional[object]:
+    runtime_class_dict = get_comprehensive_dict_for_runtime_class(runtime_class)
+
+    if '__call__' in runtime_class_dict:
+        return unwrap(runtime_class_dict['__call__'])
+    else:
+        return None
+
+
+def get_local_syntax_directed_typing_constraints_callback(
     module_name: str,
-    module_node: ast.Module,
     top_level_class_definitions_to_runtime_classes: Mapping[ast.ClassDef, RuntimeClass],
     unwrapped_runtime_functions_to_named_function_definitions: Mapping[UnwrappedRuntimeFunction, FunctionDefinition],
     named_function_definitions_to_unwrapped_runtime_functions: Mapping[FunctionDefinition, UnwrappedRuntimeFunction],
     node_to_definition_node_mapping: Mapping[ast.AST, ast.AST],
     get_runtime_terms_callback: Callable[[ast.AST], Iterable[RuntimeTerm]],
     update_runtime_terms_callback: Callable[[ast.AST, Iterable[RuntimeTerm]], Any],
-):
+    output_lines: Optional[list[str]] = None,
+) -> Callable[[ast.AST, list[NodeProvidingScope]], None]:
+    """
+    Return the `scoped_evaluation_order_node_visitor` callback handling local syntax-directed typing constraints.
+    `node_to_definition_node_mapping` only needs to be up to date for the nodes visited so far
+    (e.g. a `DisjointSet` built in the same pass), as it is only queried through `.get(node, node)`.
+    """
+    # Buffer CSV lines in `output_lines` if given, so that the caller can write them out in bulk
+    if output_lines is not None:
+        write_output_line = output_lines.append
+    else:
+        write_output_line = sys.stdout.write
+
     def get_runtime_terms_of_definition_node(node: ast.AST):
         nonlocal node_to_definition_node_mapping
 
@@ -58,143 +99,228 @@ def modified_handle_local_syntax_directed_typing_constraints(
     ):
         update_runtime_terms_of_definition_node(node, {Instance(runtime_class)})
     
-    def handle_local_syntax_directed_typing_constraints_callback(
-        node: ast.AST,
+    def get_literal_node_handler(runtime_class: RuntimeClass):
+        def handle_literal_node(
+            node: ast.AST,
+            scope_stack: list[NodeProvidingScope]
+        ):
+            # Set the current type variable to be an instance of `runtime_class`
+            update_runtime_terms_of_definition_node_from_runtime_class(node, runtime_class)
+
+        return handle_literal_node
+
+    # Literals
+    # ast.Constant(value)
+    def handle_constant_node(
+        node: ast.Constant,
         scope_stack: list[NodeProvidingScope]
     ):
-        # Literals
-        # ast.Constant(value)
-        if isinstance(node, ast.Constant):
-            # Set the current type variable to be an instance of `type(value)`
-            update_runtime_terms_of_definition_node_from_runtime_class(node, type(node.value))
-        # ast.JoinedStr(values)
-        elif isinstance(node, ast.JoinedStr):
-            # Set the current type variable to be an instance of `str`
-            update_runtime_terms_of_definition_node_from_runtime_class(node, str)
-        # ast.List(elts, ctx)
-        elif isinstance(node, ast.List):
-            # Set the current type variable to be an instance of `list`
-            update_runtime_terms_of_definition_node_from_runtime_class(node, list)
-        # ast.Tuple(elts, ctx)
-        elif isinstance(node, ast.Tuple):
-            # Set the current type variable to be an instance of `tuple`
-            update_runtime_terms_of_definition_node_from_runtime_class(node, tuple)
-        # ast.Set(elts)
-        elif isinstance(node, ast.Set):
-            # Set the current type variable to be an instance of `set`
-            update_runtime_terms_of_definition_node_from_runtime_class(node, set)
-        # ast.Dict(keys, values)
-        elif isinstance(node, ast.Dict):
-            # Set the current type variable to be an instance of `dict`
-            update_runtime_terms_of_definition_node_from_runtime_class(node, dict)
-        # Expressions
-        # ast.Call(func, args, keywords, starargs, kwargs)
-        # Output:
-        # callee_module_name,callee_class_name,callee_function_name,caller_module_name,call_line
-        elif isinstance(node, ast.Call):
-            callee_module_name: Optional[str] = None
-            callee_class_name: Optional[str] = None
-            callee_function_name: Optional[str] = None
-            caller_module_name: str = module_name
-            caller_function_name: Optional[str] = getattr(scope_stack[-1], 'name', None) if scope_stack else None
-            call_line: Optional[int] = getattr(node, 'lineno', None)
-            caller_function_start: Optional[str] = getattr(scope_stack[-1], 'lineno', None) if scope_stack else None
-            caller_function_end: Optional[str] = getattr(scope_stack[-1], 'end_lineno', None) if scope_stack else None
-
-            # Handle function call for all runtime terms
-            for runtime_term in get_runtime_terms_of_definition_node(node.func):
-                if isinstance(runtime_term, RuntimeClass):
-                    # Get the RuntimeClass's constructor
-                    if (unwrapped_constructor := get_unwrapped_constructor(runtime_term)) in unwrapped_runtime_functions_to_named_function_definitions:
-                        callee_module_name = runtime_term.__module__
-                        callee_class_name = runtime_term.__name__
-                        callee_function_name = unwrapped_constructor.__name__
-                        callee_function = unwrapped_constructor
-
-                
-                    # Add an instance of the RuntimeClass to the node
-                    update_runtime_terms_of_definition_node(
-                        node,
-                        {Instance(runtime_term)}
-                    )
-
-                elif isinstance(runtime_term, Function):
-                    if isinstance(runtime_term, FunctionDefinition) and runtime_term in named_function_definitions_to_unwrapped_runtime_functions:
-                        unwrapped_runtime_function = named_function_definitions_to_unwrapped_runtime_functions[runtime_term]
-                        callee_module_name = unwrapped_runtime_function.__module__
-                        callee_class_name = 'global'
-                        callee_function_name = unwrapped_runtime_function.__name__
-                        callee_function = unwrapped_runtime_function
-                    elif isinstance(runtime_term, UnwrappedRuntimeFunction) and runtime_term in unwrapped_runtime_functions_to_named_function_definitions:
-                        callee_module_name = runtime_term.__module__
-                        callee_class_name = 'global'
-                        callee_function_name = runtime_term.__name__
-                        callee_function = runtime_term
-                elif isinstance(runtime_term, UnboundMethod):
-                    runtime_term_class = runtime_term.class_
-                    function = runtime_term.function
-
-                    if isinstance(function, FunctionDefinition) and function in named_function_definitions_to_unwrapped_runtime_functions:
-                        unwrapped_runtime_function = named_function_definitions_to_unwrapped_runtime_functions[function]
-                        callee_module_name = runtime_term_class.__module__
-                        callee_class_name = runtime_term_class.__name__
-                        callee_function_name = unwrapped_runtime_function.__name__
-                        callee_function = unwrapped_runtime_function
-                    elif isinstance(function, UnwrappedRuntimeFunction) and function in unwrapped_runtime_functions_to_named_function_definitions:
-                        callee_module_name = runtime_term_class.__module__
-                        callee_class_name = runtime_term_class.__name__
-                        callee_function_name = function.__name__
-                        callee_function = function
-                elif isinstance(runtime_term, Instance):
-                    runtime_term_class = runtime_term.class_
-                    runtime_term_class_dict = get_comprehensive_dict_for_runtime_class(runtime_term_class)
-
-                    if '__call__' in runtime_term_class_dict:
-                        if (unwrapped_call := unwrap(runtime_term_class_dict['__call__'])) in unwrapped_runtime_functions_to_named_function_definitions:
-                            callee_module_name = runtime_term_class.__module__
-                            callee_class_name = runtime_term_class.__name__
-                            callee_function_name = unwrapped_call.__name__
-                            callee_function = unwrapped_call
-                elif isinstance(runtime_term, BoundMethod):
-                    runtime_term_instance_class = runtime_term.instance.class_
-                    function = runtime_term.function
-
-                    if isinstance(function, FunctionDefinition) and function in named_function_definitions_to_unwrapped_runtime_functions:
-                        unwrapped_runtime_function = named_function_definitions_to_unwrapped_runtime_functions[function]
-                        callee_module_name = runtime_term_instance_class.__module__
-                        callee_class_name = runtime_term_instance_class.__name__
-                        callee_function_name = unwrapped_runtime_function.__name__
-                        callee_function = unwrapped_runtime_function
-                    elif isinstance(function, UnwrappedRuntimeFunction) and function in unwrapped_runtime_functions_to_named_function_definitions:
-                        callee_module_name = runtime_term_instance_class.__module__
-                        callee_class_name = runtime_term_instance_class.__name__
-                        callee_function_name = function.__name__
-                        callee_function = function
-                
-                if callee_module_name and callee_class_name and callee_function_name:
-                    source_lines, start_line = inspect.getsourcelines(callee_function)
-                    end_line = start_line + len(source_lines) - 1
-                    signature = inspect.signature(callee_function)
-                    print(f'{callee_module_name},{callee_class_name},{callee_function_name},{start_line},{end_line},{caller_module_name},{caller_function_name},{call_line},{caller_function_start},{caller_function_end},"{signature}"')
-        # ast.Attribute(value, attr, ctx)
-        elif isinstance(node, ast.Attribute):
-            # Get the runtime terms in `value`
-            # Get the attribute access results
-            attribute_access_results = set()
-            for runtime_term in get_runtime_terms_of_definition_node(node.value):
-                attribute_access_result = get_attribute_access_result(
-                    runtime_term,
-                    node.attr,
-                    unwrapped_runtime_functions_to_named_function_definitions
+        # Set the current type variable to be an instance of `type(value)`
+        update_runtime_terms_of_definition_node_from_runtime_class(node, type(node.value))
+
+    def get_unwrapped_runtime_function_of_function(function: Function) -> Optional[UnwrappedRuntimeFunction]:
+        if isinstance(function, FunctionDefinition) and function in named_function_definitions_to_unwrapped_runtime_functions:
+            return named_function_definitions_to_unwrapped_runtime_functions[function]
+        elif isinstance(function, UnwrappedRuntimeFunction) and function in unwrapped_runtime_functions_to_named_function_definitions:
+            return function
+        else:
+            return None
+
+    def get_callee_information_of_method(
+        runtime_class: RuntimeClass,
+        function: Function
+    ) -> Optional[CalleeInformation]:
+        if (unwrapped_runtime_function := get_unwrapped_runtime_function_of_function(function)) is not None:
+            return (
+                runtime_class.__module__,
+                runtime_class.__name__,
+                unwrapped_runtime_function.__name__,
+                unwrapped_runtime_function
+            )
+        else:
+            return None
+
+    def handle_call_on_runtime_class(
+        node: ast.Call,
+        runtime_term: RuntimeClass
+    ) -> Optional[CalleeInformation]:
+        # Add an instance of the RuntimeClass to the node
+        update_runtime_terms_of_definition_node(
+            node,
+            {Instance(runtime_term)}
+        )
+
+        # Get the RuntimeClass's constructor
+        if (unwrapped_constructor := get_unwrapped_constructor(runtime_term)) in unwrapped_runtime_functions_to_named_function_definitions:
+            return (
+                runtime_term.__module__,
+                runtime_term.__name__,
+                unwrapped_constructor.__name__,
+                unwrapped_constructor
+            )
+        else:
+            return None
+
+    def handle_call_on_function(
+        node: ast.Call,
+        runtime_term: Function
+    ) -> Optional[CalleeInformation]:
+        if (unwrapped_runtime_function := get_unwrapped_runtime_function_of_function(runtime_term)) is not None:
+            return (
+                unwrapped_runtime_function.__module__,
+                'global',
+                unwrapped_runtime_function.__name__,
+                unwrapped_runtime_function
+            )
+        else:
+            return None
+
+    def handle_call_on_unbound_method(
+        node: ast.Call,
+        runtime_term: UnboundMethod
+    ) -> Optional[CalleeInformation]:
+        return get_callee_information_of_method(runtime_term.class_, runtime_term.function)
+
+    def handle_call_on_instance(
+        node: ast.Call,
+        runtime_term: Instance
+    ) -> Optional[CalleeInformation]:
+        runtime_term_class = runtime_term.class_
+
+        if (unwrapped_call := get_unwrapped_call_of_runtime_class(runtime_term_class)) is not None and unwrapped_call in unwrapped_runtime_functions_to_named_function_definitions:
+            return (
+                runtime_term_class.__module__,
+                runtime_term_class.__name__,
+                unwrapped_call.__name__,
+                unwrapped_call
+            )
+        else:
+            return None
+
+    def handle_call_on_bound_method(
+        node: ast.Call,
+        runtime_term: BoundMethod
+    ) -> Optional[CalleeInformation]:
+        return get_callee_information_of_method(runtime_term.instance.class_, runtime_term.function)
+
+    # Dispatch on the exact runtime term type; the Union aliases in type_definitions are expanded into their members
+    runtime_term_types_to_call_handlers: dict[type, Optional[Callable[[ast.Call, RuntimeTerm], Optional[CalleeInformation]]]] = {
+        RuntimeClass: handle_call_on_runtime_class,
+        **dict.fromkeys(typing.get_args(FunctionDefinition), handle_call_on_function),
+        **dict.fromkeys(typing.get_args(UnwrappedRuntimeFunction), handle_call_on_function),
+        UnboundMethod: handle_call_on_unbound_method,
+        Instance: handle_call_on_instance,
+        BoundMethod: handle_call_on_bound_method,
+    }
+
+    def get_call_handler(runtime_term: RuntimeTerm) -> Optional[Callable[[ast.Call, RuntimeTerm], Optional[CalleeInformation]]]:
+        runtime_term_type = type(runtime_term)
+        try:
+            return runtime_term_types_to_call_handlers[runtime_term_type]
+        except KeyError:
+            # Classes with a metaclass other than `type`
+            if isinstance(runtime_term, RuntimeClass):
+                call_handler = handle_call_on_runtime_class
+            else:
+                call_handler = None
+
+            # Remember the resolved handler (or the lack of one), so that the isinstance probe runs once per type
+            runtime_term_types_to_call_handlers[runtime_term_type] = call_handler
+            return call_handler
+
+    # Expressions
+    # ast.Call(func, args, keywords, starargs, kwargs)
+    # Output:
+    # callee_module_name,callee_class_name,callee_function_name,caller_module_name,call_line
+    def handle_call_node(
+        node: ast.Call,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        callee_information: Optional[CalleeInformation] = None
+        caller_module_name: str = module_name
+        caller_function_name: Optional[str] = None
+        call_line: Optional[int] = node.lineno
+        caller_function_start: Optional[int] = None
+        caller_function_end: Optional[int] = None
+
+        # Every scope-providing node has location fields, only some have a name
+        if scope_stack:
+            caller_scope = scope_stack[-1]
+            if isinstance(caller_scope, NAMED_NODE_PROVIDING_SCOPE_TYPES):
+                caller_function_name = caller_scope.name
+            caller_function_start = caller_scope.lineno
+            caller_function_end = caller_scope.end_lineno
+
+        # Handle function call for all runtime terms
+        for runtime_term in get_runtime_terms_of_definition_node(node.func):
+            if (call_handler := get_call_handler(runtime_term)) is not None:
+                if (runtime_term_callee_information := call_handler(node, runtime_term)) is not None:
+                    callee_information = runtime_term_callee_information
+
+            if callee_information is not None:
+                callee_module_name, callee_class_name, callee_function_name, callee_function = callee_information
+                start_line, end_line = get_source_line_range(callee_function)
+                signature = get_signature_string(callee_function)
+                write_output_line(f'{callee_module_name},{callee_class_name},{callee_function_name},{start_line},{end_line},{caller_module_name},{caller_function_name},{call_line},{caller_function_start},{caller_function_end},"{signature}"\n')
+
+    # ast.Attribute(value, attr, ctx)
+    def handle_attribute_node(
+        node: ast.Attribute,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        # Get the runtime terms in `value`
+        # Get the attribute access results
+        attribute_access_results = set()
+        for runtime_term in get_runtime_terms_of_definition_node(node.value):
+            attribute_access_result = get_attribute_access_result(
+                runtime_term,
+                node.attr,
+                unwrapped_runtime_functions_to_named_function_definitions
+            )
+
+            if attribute_access_result is not None:
+                attribute_access_results.add(attribute_access_result)
+        
+        # Add the runtime terms to the node
+        update_runtime_terms_of_definition_node(node, attribute_access_results)
+
+    # ast.NamedExpr(target, value)
+    def handle_named_expr_node(
+        node: ast.NamedExpr,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        # Transfer runtime terms from `value` to `target`.
+        update_runtime_terms_of_definition_node(
+            node.target,
+            get_runtime_terms_of_definition_node(
+                node.value
+            )
+        )
+
+    # Statements
+    # ast.Assign(targets, value, type_comment)
+    def handle_assign_node(
+        node: ast.Assign,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        # Walk the chain `t1 = t2 = ... = tn = value` from right to left without building an intermediate list
+        value = node.value
+        for target in reversed(node.targets):
+            # Transfer runtime terms from `value` to `target`.
+            update_runtime_terms_of_definition_node(
+                target,
+                get_runtime_terms_of_definition_node(
+                    value
                 )
+            )
+            value = target
 
-                if attribute_access_result is not None:
-                    attribute_access_results.add(attribute_access_result)
-            
-            # Add the runtime terms to the node
-            update_runtime_terms_of_definition_node(node, attribute_access_results)
-        # ast.NamedExpr(target, value)
-        elif isinstance(node, ast.NamedExpr):
+    # ast.AnnAssign(target, annotation, value, simple)
+    def handle_ann_assign_node(
+        node: ast.AnnAssign,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        if node.value is not None:
             # Transfer runtime terms from `value` to `target`.
             update_runtime_terms_of_definition_node(
                 node.target,
@@ -202,59 +328,91 @@ def modified_handle_local_syntax_directed_typing_constraints(
                     node.value
                 )
             )
+
+    # Function Definition
+    def handle_function_definition_node(
+        node: FunctionDefinition,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        # Add runtime terms
+        update_runtime_terms_of_definition_node(node, {node})
+
+    # ast.ClassDef(name, bases, keywords, body, decorator_list, type_params)
+    def handle_class_def_node(
+        node: ast.ClassDef,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        if node in top_level_class_definitions_to_runtime_classes:
+            runtime_class = top_level_class_definitions_to_runtime_classes[node]
+
+            # Add runtime terms
+            update_runtime_terms_of_definition_node(node, {runtime_class})
+
+    # Dispatch on the exact node type with a single dict lookup instead of an isinstance chain
+    node_types_to_handlers: dict[type, Callable[[ast.AST, list[NodeProvidingScope]], Any]] = {
+        ast.Constant: handle_constant_node,
+        # ast.JoinedStr(values)
+        ast.JoinedStr: get_literal_node_handler(str),
+        # ast.List(elts, ctx)
+        ast.List: get_literal_node_handler(list),
+        # ast.Tuple(elts, ctx)
+        ast.Tuple: get_literal_node_handler(tuple),
+        # ast.Set(elts)
+        ast.Set: get_literal_node_handler(set),
+        # ast.Dict(keys, values)
+        ast.Dict: get_literal_node_handler(dict),
+        ast.Call: handle_call_node,
+        ast.Attribute: handle_attribute_node,
+        ast.NamedExpr: handle_named_expr_node,
         # Comprehensions
         # ast.ListComp(elt, generators)
-        elif isinstance(node, ast.ListComp):
-            # Set the current type variable as equivalent to `list`.
-            update_runtime_terms_of_definition_node_from_runtime_class(node, list)
+        ast.ListComp: get_literal_node_handler(list),
         # ast.SetComp(elt, generators)
-        elif isinstance(node, ast.SetComp):
-            # Set the current type variable as equivalent to `set`.
-            update_runtime_terms_of_definition_node_from_runtime_class(node, set)
+        ast.SetComp: get_literal_node_handler(set),
         # ast.GeneratorExp(elt, generators)
-        elif isinstance(node, ast.GeneratorExp):
-            # Set the current type variable as equivalent to `collections.abc.Generator`.
-            update_runtime_terms_of_definition_node_from_runtime_class(node, collections.abc.Generator)
+        ast.GeneratorExp: get_literal_node_handler(collections.abc.Generator),
         # ast.DictComp(key, value, generators)
-        elif isinstance(node, ast.DictComp):
-            # Set the current type variable as equivalent to `dict`.
-            update_runtime_terms_of_definition_node_from_runtime_class(node, dict)
-        # Statements
-        # ast.Assign(targets, value, type_comment)
-        elif isinstance(node, ast.Assign):
-            for (value, target) in itertools.pairwise(
-                reversed(node.targets + [node.value])
-            ):
-                # Transfer runtime terms from `value` to `target`.
-                update_runtime_terms_of_definition_node(
-                    target,
-                    get_runtime_terms_of_definition_node(
-                        value
-                    )
-                )
-        # ast.AnnAssign(target, annotation, value, simple)
-        elif isinstance(node, ast.AnnAssign):
-            if node.value is not None:
-                # Transfer runtime terms from `value` to `target`.
-                update_runtime_terms_of_definition_node(
-                    node.target,
-                    get_runtime_terms_of_definition_node(
-                        node.value
-                    )
-                )
-        # Function Definition
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
-            # Add runtime terms
-            update_runtime_terms_of_definition_node(node, {node})
-        # ast.ClassDef(name, bases, keywords, body, decorator_list, type_params)
-        elif isinstance(node, ast.ClassDef):
-            if node in top_level_class_definitions_to_runtime_classes:
-                runtime_class = top_level_class_definitions_to_runtime_classes[node]
+        ast.DictComp: get_literal_node_handler(dict),
+        ast.Assign: handle_assign_node,
+        ast.AnnAssign: handle_ann_assign_node,
+        ast.FunctionDef: handle_function_definition_node,
+        ast.AsyncFunctionDef: handle_function_definition_node,
+        ast.Lambda: handle_function_definition_node,
+        ast.ClassDef: handle_class_def_node,
+    }
+
+    def handle_local_syntax_directed_typing_constraints_callback(
+        node: ast.AST,
+        scope_stack: list[NodeProvidingScope]
+    ):
+        handler = node_types_to_handlers.get(type(node))
+        if handler is not None:
+            handler(node, scope_stack)
 
-                # Add runtime terms
-                update_runtime_terms_of_definition_node(node, {runtime_class})
+    return handle_local_syntax_directed_typing_constraints_callback
 
+
+def modified_handle_local_syntax_directed_typing_constraints(
+    module_name: str,
+    module_node: ast.Module,
+    top_level_class_definitions_to_runtime_classes: Mapping[ast.ClassDef, RuntimeClass],
+    unwrapped_runtime_functions_to_named_function_definitions: Mapping[UnwrappedRuntimeFunction, FunctionDefinition],
+    named_function_definitions_to_unwrapped_runtime_functions: Mapping[FunctionDefinition, UnwrappedRuntimeFunction],
+    node_to_definition_node_mapping: Mapping[ast.AST, ast.AST],
+    get_runtime_terms_callback: Callable[[ast.AST], Iterable[RuntimeTerm]],
+    update_runtime_terms_callback: Callable[[ast.AST, Iterable[RuntimeTerm]], Any],
+    output_lines: Optional[list[str]] = None,
+):
     return scoped_evaluation_order_node_visitor(
         module_node,
-        handle_local_syntax_directed_typing_constraints_callback
+        get_local_syntax_directed_typing_constraints_callback(
+            module_name,
+            top_level_class_definitions_to_runtime_classes,
+            unwrapped_runtime_functions_to_named_function_definitions,
+            named_function_definitions_to_unwrapped_runtime_functions,
+            node_to_definition_node_mapping,
+            get_runtime_terms_callback,
+            update_runtime_terms_callback,
+            output_lines,
+        )
     )
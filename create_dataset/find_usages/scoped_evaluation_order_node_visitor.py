@@ -16,6 +16,13 @@ NodeProvidingScope = typing.Union[
         ast.GeneratorExp
 ]
 
+# Subset of NodeProvidingScope that has a `name` field
+NAMED_NODE_PROVIDING_SCOPE_TYPES = (
+        ast.ClassDef,
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+)
+
 
 def scoped_evaluation_order_node_visitor(
     node: ast.AST,
@@ -3,3 +3,21 @@ def unwrap(o: object) -> object:
         return getattr(o, '__wrapped__')
     else:
         return o
+
+
+# id(o) -> (o, unwrap(o))
+# Keeping `o` alive guarantees its id is not reused by another object while cached.
+# The cached objects are module-level functions and classes, which stay alive for the whole run anyway.
+_ids_to_objects_and_unwrapped_objects: dict[int, tuple[object, object]] = {}
+
+
+def cached_unwrap(o: object) -> object:
+    """
+    Same as `unwrap`, memoized on object identity, so that it also works for unhashable objects.
+    """
+    if (object_and_unwrapped_object := _ids_to_objects_and_unwrapped_objects.get(id(o))) is not None and object_and_unwrapped_object[0] is o:
+        return object_and_unwrapped_object[1]
+
+    unwrapped_object = unwrap(o)
+    _ids_to_objects_and_unwrapped_objects[id(o)] = (o, unwrapped_object)
+    return unwrapped_object
@@ -59,6 +59,7 @@ class AnsiTextWrapper:
     tabsize: int = ...
     max_lines: _Optional[int] = ...
     placeholder: str = ...
+    optimal: bool = ...
 
     # Attributes not present in documentation
     sentence_end_re: _Pattern[str] = ...
@@ -84,6 +85,7 @@ class AnsiTextWrapper:
         *,
         max_lines: _Optional[int] = ...,
         placeholder: str = ...,
+        optimal: bool = ...,
     ) -> None: ...
 
     # Private methods *are* part of the documented API for subclasses.
@@ -163,7 +165,9 @@ def bump_version(
 class cached_property:
     __doc__: _Any = ...
     func: _Any = ...
+    attrname: str = ...
     def __init__(self, func: _Any) -> None: ...
+    def __set_name__(self, owner: _Any, name: str) -> None: ...
     def __get__(self, obj: _Any, cls: _Any) -> _Any: ...
 
 # noinspection PyUnusedFunction
@@ -9,21 +9,25 @@ class cached_property:
     def __init__(self, func):
         self.__doc__ = getattr(func, "__doc__")
         self.func = func
+        self.attrname = func.__name__
+        self._is_coroutine = asyncio.iscoroutinefunction(func)
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.attrname = name
 
     def __get__(self, obj: Any, cls):
         if obj is None:
             return self
-        if asyncio.iscoroutinefunction(self.func):
+        if self._is_coroutine:
             return self._wrap_in_coroutine(obj)
-        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        value = obj.__dict__[self.attrname] = self.func(obj)
         return value
 
     def _wrap_in_coroutine(self, obj):
 
-        @asyncio.coroutine
-        def wrapper():
+        async def wrapper():
             future = asyncio.ensure_future(self.func(obj))
-            obj.__dict__[self.func.__name__] = future
-            return future
+            obj.__dict__[self.attrname] = future
+            return await future
 
         return wrapper()
@@ -21,47 +21,42 @@ _LIST_LIKE = (
     KeysView,
     UserList,
 )
+_MISSING = object()
 
 
 def has_any_attrs(obj: _Any, *attrs: str) -> bool:
     for attr in attrs:
-        if hasattr(obj, attr) is True:
+        if hasattr(obj, attr):
             return True
     return False
 
 
 def has_any_callables(obj: _Any, *attrs: str) -> bool:
-    if has_any_attrs(obj, *attrs) is True:
-        for attr in attrs:
-            if callable(getattr(obj, attr)) is True:
-                return True
+    for attr in attrs:
+        value = getattr(obj, attr, _MISSING)
+        if value is not _MISSING and callable(value):
+            return True
     return False
 
 
 def has_attrs(obj: _Any, *attrs: str) -> bool:
     for attr in attrs:
-        if hasattr(obj, attr) is False:
+        if not hasattr(obj, attr):
             return False
     return True
 
 
 def has_callables(obj: _Any, *attrs: str) -> bool:
-    if has_attrs(obj, *attrs) is True:
-        for attr in attrs:
-            if callable(getattr(obj, attr)) is False:
-                return False
-        return True
-    return False
+    for attr in attrs:
+        value = getattr(obj, attr, _MISSING)
+        if value is _MISSING or not callable(value):
+            return False
+    return True
 
 
 def is_list_like(obj: _Any) -> bool:
-    if is_subclass_of_any(obj, *_LIST_LIKE):
-        return True
-    return False
+    return isinstance(obj, _LIST_LIKE)
 
 
 def is_subclass_of_any(obj: _Any, *classes: _Any) -> bool:
-    for cls in classes:
-        if issubclass(obj.__class__, cls):
-            return True
-    return False
+    return isinstance(obj, classes)
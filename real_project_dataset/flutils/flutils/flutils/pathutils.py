@@ -22,6 +22,8 @@ __all__ = [
 ]
 _PATH = Union[PathLike, PosixPath, WindowsPath, bytes, str]
 _STR_OR_INT_OR_NONE = Union[str, int, None]
+_DEFAULT_FILE_MODE = 384
+_DEFAULT_DIR_MODE = 448
 
 
 def chmod(
@@ -32,12 +34,13 @@ def chmod(
 ) -> None:
     path = normalize_path(path)
     if mode_file is None:
-        mode_file = 384
+        mode_file = _DEFAULT_FILE_MODE
     if mode_dir is None:
-        mode_dir = 448
-    if "*" in path.as_posix():
+        mode_dir = _DEFAULT_DIR_MODE
+    pattern = path.as_posix()
+    if "*" in pattern:
         try:
-            for sub_path in Path().glob(path.as_posix()):
+            for sub_path in Path().glob(pattern):
                 if sub_path.is_dir() is True:
                     sub_path.chmod(mode_dir)
                 elif sub_path.is_file():
@@ -49,11 +52,10 @@ def chmod(
                 parent = path.parent
                 if parent.is_dir():
                     parent.chmod(mode_dir)
-    elif path.exists() is True:
-        if path.is_dir():
-            path.chmod(mode_dir)
-        elif path.is_file():
-            path.chmod(mode_file)
+    elif path.is_dir():
+        path.chmod(mode_dir)
+    elif path.is_file():
+        path.chmod(mode_file)
 
 
 def chown(
@@ -1,9 +1,16 @@
 import os
+import re
+import sys
 from configparser import ConfigParser, NoOptionError, NoSectionError
-from traceback import FrameSummary, extract_stack
+from functools import lru_cache
+from types import FrameType
 from typing import Dict, Generator, List, NamedTuple, Optional, Tuple, Union, cast
 from flutils.strutils import underscore_to_camel
 
+_CFG_SECTION_RE = re.compile(r"\[(?P<header>.+)\]")
+_CFG_OPTION_RE = re.compile(r"(?P<option>.*?)\s*[=:]\s*(?P<value>.*)$")
+_COMMAND_SECTION_PREFIX = "setup.command."
+
 
 class SetupCfgCommandConfig(NamedTuple):
     name: str
@@ -15,11 +22,11 @@ class SetupCfgCommandConfig(NamedTuple):
 def _each_setup_cfg_command_section(
     parser: ConfigParser,
 ) -> Generator[Tuple[str, str], None, None]:
+    prefix_len = len(_COMMAND_SECTION_PREFIX)
     for section in parser.sections():
-        section = cast(str, section)
-        section = section.strip()
-        if section.startswith("setup.command."):
-            command_name = ".".join(section.split(".")[2:])
+        section = cast(str, section).strip()
+        if section.startswith(_COMMAND_SECTION_PREFIX):
+            command_name = section[prefix_len:]
             if command_name:
                 yield section, command_name
 
@@ -99,16 +106,25 @@ def _validate_setup_dir(setup_dir: str) -> None:
         )
 
 
+def _stack_filenames() -> List[str]:
+    out: List[str] = []
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        out.append(frame.f_code.co_filename)
+        frame = frame.f_back
+    out.reverse()
+    return out
+
+
 def _prep_setup_dir(setup_dir: Optional[Union[os.PathLike, str]] = None) -> str:
     if setup_dir:
         setup_dir = str(setup_dir)
         _validate_setup_dir(setup_dir)
         return os.path.realpath(setup_dir)
-    for fs in extract_stack():
-        fs = cast(FrameSummary, fs)
-        basename = os.path.basename(fs.filename)
+    for filename in _stack_filenames():
+        basename = os.path.basename(filename)
         if basename == "setup.py":
-            setup_dir = str(os.path.dirname(fs.filename))
+            setup_dir = str(os.path.dirname(filename))
             _validate_setup_dir(setup_dir)
             return os.path.realpath(setup_dir)
     raise FileNotFoundError(
@@ -116,6 +132,77 @@ def _prep_setup_dir(setup_dir: Optional[Union[os.PathLike, str]] = None) -> str:
     )
 
 
+def _parse_cfg(text: str) -> Optional[Dict[str, Dict[str, str]]]:
+    if "%" in text:
+        return None
+    sections: Dict[str, Dict[str, List[str]]] = {}
+    section: Optional[Dict[str, List[str]]] = None
+    values: Optional[List[str]] = None
+    indent_level = 0
+    for line in text.split("\n"):
+        value = line.strip()
+        if not value:
+            if values is not None:
+                values.append("")
+            continue
+        if value[0] in "#;":
+            continue
+        cur_indent_level = len(line) - len(line.lstrip())
+        if values is not None and cur_indent_level > indent_level:
+            values.append(value)
+            continue
+        indent_level = cur_indent_level
+        match = _CFG_SECTION_RE.match(value)
+        if match is not None:
+            name = match.group("header")
+            if name in sections or name == "DEFAULT":
+                return None
+            section = sections[name] = {}
+            values = None
+            continue
+        match = _CFG_OPTION_RE.match(value)
+        if section is None or match is None:
+            return None
+        option = match.group("option").rstrip().lower()
+        if not option or option in section:
+            return None
+        values = section[option] = [match.group("value").strip()]
+    return {
+        name: {key: "\n".join(val).rstrip() for key, val in options.items()}
+        for name, options in sections.items()
+    }
+
+
+def _load_cfg_data(path: str) -> Optional[Dict[str, Dict[str, str]]]:
+    try:
+        with open(path) as f:
+            return _parse_cfg(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+@lru_cache(maxsize=32)
+def _read_cached_cfg_data(
+    path: str, stamp: Tuple[int, int]
+) -> Optional[Dict[str, Dict[str, str]]]:
+    return _load_cfg_data(path)
+
+
+def _read_cfg(path: str) -> ConfigParser:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        data = _load_cfg_data(path)
+    else:
+        data = _read_cached_cfg_data(path, (stat.st_mtime_ns, stat.st_size))
+    parser = ConfigParser()
+    if data is None:
+        parser.read(path)
+    else:
+        parser.read_dict(data)
+    return parser
+
+
 def each_sub_command_config(
     setup_dir: Optional[Union[os.PathLike, str]] = None
 ) -> Generator[SetupCfgCommandConfig, None, None]:
@@ -124,11 +211,9 @@ def each_sub_command_config(
         "home": os.path.expanduser("~"),
     }
     setup_cfg_path = os.path.join(format_kwargs["setup_dir"], "setup.cfg")
-    parser = ConfigParser()
-    parser.read(setup_cfg_path)
+    parser = _read_cfg(setup_cfg_path)
     format_kwargs["name"] = _get_name(parser, setup_cfg_path)
     path = os.path.join(format_kwargs["setup_dir"], "setup_commands.cfg")
     if os.path.isfile(path):
-        parser = ConfigParser()
-        parser.read(path)
+        parser = _read_cfg(path)
     yield from _each_setup_cfg_command(parser, format_kwargs)
@@ -1,30 +1,42 @@
 import re
 from itertools import chain
-from sys import hexversion
+from sys import intern
 from textwrap import TextWrapper
-from typing import List, Optional, Sequence, cast
+from typing import Dict, List, Optional, Sequence, cast
 
-if hexversion >= 50855936:
-    from functools import cached_property
-else:
-    from .decorators import cached_property
 __all__ = ["len_without_ansi", "AnsiTextWrapper"]
-_ANSI_RE = re.compile("(\x1b\\[[0-9;:]+[ABCDEFGHJKSTfhilmns])")
+_ANSI_RE = re.compile("(\x1b\\[[0-9;:]+[ABCDEFGHJKSTfhilmns])", re.ASCII)
+_ANSI_PARAMS = "0123456789;:"
+_ANSI_FINALS = frozenset("ABCDEFGHJKSTfhilmns")
 
 
 def len_without_ansi(seq: Sequence) -> int:
     if hasattr(seq, "capitalize"):
-        _text: str = cast(str, seq)
-        seq = [c for c in _ANSI_RE.split(_text) if c]
-    seq = [c for c in chain(*map(_ANSI_RE.split, seq)) if c]
+        seq = (cast(str, seq),)
+    elif not hasattr(seq, "__getitem__"):
+        seq = tuple(seq)
     seq = cast(Sequence[str], seq)
+    joined = "".join(seq)
+    if "\x1b" not in joined:
+        return len(joined)
     out = 0
     for text in seq:
-        if hasattr(text, "capitalize"):
-            if text.startswith("\x1b[") and text.endswith("m"):
-                continue
-            else:
+        if "\x1b" not in text:
+            out += len(text)
+            continue
+        if (
+            len(text) > 3
+            and text[-1] in _ANSI_FINALS
+            and text.startswith("\x1b[")
+            and not text[2:-1].strip(_ANSI_PARAMS)
+        ):
+            if text[-1] != "m":
                 out += len(text)
+            continue
+        for chunk in _ANSI_RE.split(text):
+            if chunk.startswith("\x1b[") and chunk.endswith("m"):
+                continue
+            out += len(chunk)
     return out
 
 
@@ -44,7 +56,8 @@ class AnsiTextWrapper(TextWrapper):
         tabsize: int = 8,
         *,
         max_lines: Optional[int] = None,
-        placeholder: str = " [...]"
+        placeholder: str = " [...]",
+        optimal: bool = False
     ) -> None:
         self.__initial_indent: str = ""
         self.__subsequent_indent: str = ""
@@ -61,6 +74,7 @@ class AnsiTextWrapper(TextWrapper):
         self.tabsize: int = tabsize
         self.max_lines: Optional[int] = max_lines
         self.placeholder = placeholder
+        self.optimal: bool = optimal
 
     @property
     def initial_indent(self) -> str:
@@ -69,14 +83,11 @@ class AnsiTextWrapper(TextWrapper):
     @initial_indent.setter
     def initial_indent(self, value: str) -> None:
         self.__initial_indent = value
-        if "initial_indent_len" in self.__dict__.keys():
-            del self.__dict__["initial_indent_len"]
+        self.__initial_indent_len = 0 if not value else len_without_ansi(value)
 
-    @cached_property
+    @property
     def initial_indent_len(self) -> int:
-        if not self.initial_indent:
-            return 0
-        return len_without_ansi(self.initial_indent)
+        return self.__initial_indent_len
 
     @property
     def subsequent_indent(self) -> str:
@@ -85,14 +96,11 @@ class AnsiTextWrapper(TextWrapper):
     @subsequent_indent.setter
     def subsequent_indent(self, value: str) -> None:
         self.__subsequent_indent = value
-        if "subsequent_indent_len" in self.__dict__.keys():
-            del self.__dict__["subsequent_indent_len"]
+        self.__subsequent_indent_len = 0 if not value else len_without_ansi(value)
 
-    @cached_property
+    @property
     def subsequent_indent_len(self) -> int:
-        if not self.subsequent_indent:
-            return 0
-        return len_without_ansi(self.subsequent_indent)
+        return self.__subsequent_indent_len
 
     @property
     def placeholder(self) -> str:
@@ -101,29 +109,112 @@ class AnsiTextWrapper(TextWrapper):
     @placeholder.setter
     def placeholder(self, value: str) -> None:
         self.__placeholder = value
-        if "placeholder_len" in self.__dict__.keys():
-            del self.__dict__["placeholder_len"]
+        self.__placeholder_len = 0 if not value.lstrip() else len_without_ansi(value)
 
-    @cached_property
+    @property
     def placeholder_len(self) -> int:
-        if not self.placeholder.lstrip():
-            return 0
-        return len_without_ansi(self.placeholder)
+        return self.__placeholder_len
 
     def _split(self, text: str) -> List[str]:
         chunks = super()._split(text)
-        return [c for c in chain(*map(_ANSI_RE.split, chunks)) if c]
+        if "\x1b" not in text:
+            return chunks
+        return [
+            intern(c) if c.startswith("\x1b[") else c
+            for c in chain(*map(_ANSI_RE.split, chunks))
+            if c
+        ]
+
+    def _wrap_optimal(self, chunks: List[str]) -> Optional[List[str]]:
+        total = len(chunks)
+        widths = [len_without_ansi(c) if "\x1b" in c else len(c) for c in chunks]
+        blank = [not c.strip() for c in chunks]
+        escape = [w == 0 and not b for w, b in zip(widths, blank)]
+        if all(blank):
+            return None
+        offsets = [0]
+        for width in widths:
+            offsets.append(offsets[-1] + width)
+        costs: List[Optional[int]] = [None] * total + [0]
+        ends = [total] * (total + 1)
+        for start in range(total - 1, -1, -1):
+            if start > 0 and (
+                escape[start] or escape[start - 1] and not blank[start]
+            ):
+                continue
+            if start == 0:
+                available = self.width - self.initial_indent_len
+            else:
+                available = self.width - self.subsequent_indent_len
+            first = start
+            if self.drop_whitespace and start > 0 and blank[start]:
+                first += 1
+            visible = False
+            for end in range(first + 1, total + 1):
+                visible = visible or not blank[end - 1]
+                line_len = offsets[end] - offsets[first]
+                if self.drop_whitespace and blank[end - 1]:
+                    line_len -= widths[end - 1]
+                if line_len > available:
+                    break
+                rest = costs[end]
+                if visible is False or rest is None:
+                    continue
+                if end < total:
+                    rest += (available - line_len) ** 2
+                if costs[start] is None or rest <= costs[start]:
+                    costs[start] = rest
+                    ends[start] = end
+        if costs[0] is None:
+            return None
+        lines = []
+        start = 0
+        while start < total:
+            end = ends[start]
+            if start == 0:
+                indent = self.initial_indent
+            else:
+                indent = self.subsequent_indent
+            line = chunks[start:end]
+            if self.drop_whitespace:
+                if start > 0 and blank[start]:
+                    del line[0]
+                if line and not line[-1].strip():
+                    del line[-1]
+            lines.append(indent + "".join(line))
+            start = end
+        return lines
 
     def _wrap_chunks(self, chunks: List[str]) -> List[str]:
+        if self.optimal and self.max_lines is None and self.width > 0:
+            lines = self._wrap_optimal(chunks)
+            if lines is not None:
+                return lines
+        if (
+            (self.max_lines is None or self.placeholder_len == len(self.placeholder))
+            and "\x1b" not in self.initial_indent
+            and "\x1b" not in self.subsequent_indent
+            and "\x1b" not in self.placeholder
+            and not any("\x1b" in c for c in chunks)
+        ):
+            return super()._wrap_chunks(chunks)
         lines = []
+        chunk_widths: Dict[str, int] = {}
+
+        def chunk_len(chunk: str) -> int:
+            try:
+                return chunk_widths[chunk]
+            except KeyError:
+                out = chunk_widths[chunk] = len_without_ansi(chunk)
+                return out
+
         if self.width <= 0:
             raise ValueError("invalid width %r (must be > 0)" % self.width)
         if self.max_lines is not None:
             if self.max_lines > 1:
-                indent = self.subsequent_indent
+                indent_len = self.subsequent_indent_len
             else:
-                indent = self.initial_indent
-            indent_len = len_without_ansi(indent)
+                indent_len = self.initial_indent_len
             _placeholder_len = len_without_ansi(self.placeholder.lstrip())
             if indent_len + _placeholder_len > self.width:
                 raise ValueError("placeholder too large for max width")
@@ -134,25 +225,26 @@ class AnsiTextWrapper(TextWrapper):
             cur_len = 0
             if lines:
                 indent = self.subsequent_indent
+                indent_len = self.subsequent_indent_len
             else:
                 indent = self.initial_indent
-            indent_len = len_without_ansi(indent)
+                indent_len = self.initial_indent_len
             width = self.width - indent_len
             if self.drop_whitespace and chunks[-1].strip() == "" and lines:
                 del chunks[-1]
             while chunks:
-                l = len_without_ansi(chunks[-1])
+                l = chunk_len(chunks[-1])
                 if cur_len + l <= width:
                     cur_line.append(chunks.pop())
                     cur_len += l
                     continue
                 else:
                     break
-            if chunks and len_without_ansi(chunks[-1]) > width:
+            if chunks and chunk_len(chunks[-1]) > width:
                 self._handle_long_word(chunks, cur_line, cur_len, width)
-                cur_len = sum(map(len_without_ansi, cur_line))
+                cur_len = sum(map(chunk_len, cur_line))
             if self.drop_whitespace and cur_line and cur_line[-1].strip() == "":
-                cur_len -= len_without_ansi(cur_line[-1])
+                cur_len -= chunk_len(cur_line[-1])
                 del cur_line[-1]
             if cur_line:
                 if (
@@ -176,7 +268,7 @@ class AnsiTextWrapper(TextWrapper):
                             cur_line.append(self.placeholder)
                             lines.append(indent + "".join(cur_line))
                             break
-                        cur_len -= len_without_ansi(cur_line[-1])
+                        cur_len -= chunk_len(cur_line[-1])
                         del cur_line[-1]
                     else:
                         if lines:
@@ -0,0 +1,12 @@
+from typing import Any, Callable
+
+
+class LazyMsg:
+    # Assertion message that is only built when unittest renders a failure.
+
+    def __init__(self, func: Callable[..., str], *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.func(*self.args)
@@ -0,0 +1,17 @@
+from flutils.codecs import register_codecs
+
+from .. import LazyMsg
+
+__all__ = ["LazyMsg", "setup_codecs"]
+
+_REGISTERED = False
+
+
+def setup_codecs() -> None:
+    # Register the flutils codecs once per interpreter, no matter
+    # which of the codec test modules is loaded first.
+    global _REGISTERED
+    if _REGISTERED is False:
+        register_codecs()
+        _REGISTERED = True
+
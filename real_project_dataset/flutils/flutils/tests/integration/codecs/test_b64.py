@@ -1,11 +1,11 @@
 import base64
-import pickle
+import marshal
 import unittest
 from collections import UserString
-from typing import Any, Dict, List, NamedTuple
-from flutils.codecs.b64 import decode, encode, register
+from typing import Any, Dict, List, NamedTuple, Tuple
+from flutils.codecs.b64 import decode, encode
+from . import LazyMsg, setup_codecs
 
-register()
 NAME = "b64"
 
 
@@ -19,6 +19,13 @@ class AStringPatched(UserString):
         return self.data.encode(*args, **kwargs)
 
 
+# Some Python versions have a UserString.encode that does not return
+# bytes; probe that once with an ASCII-only value.
+USER_STRING_CLS = AString
+if isinstance(AString("Testing1").encode("ascii"), bytes) is False:
+    USER_STRING_CLS = AStringPatched
+
+
 class Values(NamedTuple):
     obj: Any
     obj_bytes: bytes
@@ -29,28 +36,20 @@ class Values(NamedTuple):
     b64_str_len: int
 
 
-TEST_VALUES: List[Values] = []
-
-
 def _wrap(data: str) -> str:
     combined_length = len(data) + 4
     if combined_length > 60:
-        out = ""
-        tmp_data = data
-        while tmp_data:
-            if len(tmp_data) > 56:
-                out += "    %s\n" % tmp_data[0:56]
-                tmp_data = tmp_data[56:]
-            else:
-                out += "    %s\n" % tmp_data
-                tmp_data = ""
-        return out
+        return "".join(
+            "    %s\n" % data[i:i + 56] for i in range(0, len(data), 56)
+        )
     return data
 
 
 def _build_value(obj: Any) -> Values:
     kwargs: Dict[str, Any] = dict(obj=obj)
-    kwargs["obj_bytes"] = pickle.dumps(obj)
+    # The seeded values are builtins, which marshal serializes
+    # without going through pickle's opcode machinery.
+    kwargs["obj_bytes"] = marshal.dumps(obj)
     kwargs["obj_bytes_len"] = len(kwargs["obj_bytes"])
     kwargs["b64_bytes"] = base64.b64encode(kwargs["obj_bytes"])
     kwargs["b64_str"] = kwargs["b64_bytes"].decode("utf-8")
@@ -60,31 +59,48 @@ def _build_value(obj: Any) -> Values:
     return out
 
 
-def _add_value(obj: Any) -> None:
-    vals = _build_value(obj)
-    TEST_VALUES.append(vals)
+SEEDS: Tuple[Any, ...] = (
+    "Test",
+    "Testing One Two Three Four Five Six Seven Eight Nine Ten Eleven TwelveThirteen Fourteen Fifteen Sixteen Seventeen Eighteen Nineteen Twenty",
+    1,
+    True,
+    None,
+    dict(a=1, b=2),
+)
 
 
-_add_value("Test")
-_add_value(
-    "Testing One Two Three Four Five Six Seven Eight Nine Ten Eleven TwelveThirteen Fourteen Fifteen Sixteen Seventeen Eighteen Nineteen Twenty"
-)
-_add_value(1)
-_add_value(True)
-_add_value(None)
-_add_value(dict(a=1, b=2))
+TEST_VALUES: List[Values] = [_build_value(obj) for obj in SEEDS]
 
 
+def setUpModule() -> None:
+    setup_codecs()
+
+
+def _expand_test_values(cls: type) -> type:
+    # Install a ``test_<name>_<index>`` method for every ``_check_<name>``
+    # method and every value in TEST_VALUES, so each value runs as its
+    # own test case instead of as a ``subTest`` inside a loop.
+    for attr, func in list(vars(cls).items()):
+        if not attr.startswith("_check_"):
+            continue
+        for index, v in enumerate(TEST_VALUES):
+            def test(self: unittest.TestCase, func=func, v=v) -> None:
+                func(self, v)
+            test.__name__ = "test_%s_%d" % (attr[len("_check_"):], index)
+            test.__qualname__ = "%s.%s" % (cls.__qualname__, test.__name__)
+            setattr(cls, test.__name__, test)
+    return cls
+
+
+@_expand_test_values
 class TestB64(unittest.TestCase):
 
-    def test_encode_value_bytes(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = encode(v.b64_str_wrapped)[0]
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes,
-                    msg=f"""
+    def _check_encode_value_bytes(self, v: Values) -> None:
+        ret = encode(v.b64_str_wrapped)[0]
+        self.assertEqual(
+            ret,
+            v.obj_bytes,
+            msg=LazyMsg(lambda: f"""
 
 encode({v.b64_str!r})[0]
 
@@ -92,17 +108,15 @@ expected: {v.obj_bytes!r}
 
      got: {ret!r}
 
-""",
-                )
+"""),
+        )
 
-    def test_encode_consumed_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = encode(v.b64_str)[1]
-                self.assertEqual(
-                    ret,
-                    v.b64_str_len,
-                    msg=f"""
+    def _check_encode_consumed_value(self, v: Values) -> None:
+        ret = encode(v.b64_str)[1]
+        self.assertEqual(
+            ret,
+            v.b64_str_len,
+            msg=LazyMsg(lambda: f"""
 
 encode({v.b64_str!r})[1]
 
@@ -110,17 +124,15 @@ expected: {v.b64_str_len!r}
 
      got: {ret!r}
 
-""",
-                )
+"""),
+        )
 
-    def test_decode_value_bytes(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = decode(v.obj_bytes)[0]
-                self.assertEqual(
-                    ret,
-                    v.b64_str,
-                    msg=f"""
+    def _check_decode_value_bytes(self, v: Values) -> None:
+        ret = decode(v.obj_bytes)[0]
+        self.assertEqual(
+            ret,
+            v.b64_str,
+            msg=LazyMsg(lambda: f"""
 
 decode({v.obj_bytes!r})[0]
 
@@ -128,17 +140,15 @@ expected: {v.b64_str!r}
 
      got: {ret!r}
 
-""",
-                )
+"""),
+        )
 
-    def test_decode_consumed_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = decode(v.obj_bytes)[1]
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes_len,
-                    msg=f"""
+    def _check_decode_consumed_value(self, v: Values) -> None:
+        ret = decode(v.obj_bytes)[1]
+        self.assertEqual(
+            ret,
+            v.obj_bytes_len,
+            msg=LazyMsg(lambda: f"""
 
 decode({v.obj_bytes!r})[1]
 
@@ -146,17 +156,15 @@ expected: {v.obj_bytes_len!r}
 
      got: {ret!r}
 
-""",
-                )
+"""),
+        )
 
-    def test_registered_encode_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = v.b64_str_wrapped.encode(NAME)
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes,
-                    msg=f"""
+    def _check_registered_encode_value(self, v: Values) -> None:
+        ret = v.b64_str_wrapped.encode(NAME)
+        self.assertEqual(
+            ret,
+            v.obj_bytes,
+            msg=LazyMsg(lambda: f"""
 
 {v.b64_str_wrapped!r}).encode({NAME!r})
 
@@ -164,17 +172,15 @@ expected: {v.obj_bytes!r}
 
      got: {ret!r}
 
-""",
-                )
+"""),
+        )
 
-    def test_registered_decode_value(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                ret = v.obj_bytes.decode(NAME)
-                self.assertEqual(
-                    ret,
-                    v.b64_str,
-                    msg=f"""
+    def _check_registered_decode_value(self, v: Values) -> None:
+        ret = v.obj_bytes.decode(NAME)
+        self.assertEqual(
+            ret,
+            v.b64_str,
+            msg=LazyMsg(lambda: f"""
 
 {v.obj_bytes!r}).encode({NAME!r})
 
@@ -182,25 +188,16 @@ expected: {v.b64_str!r}
 
      got: {ret!r}
 
-""",
-                )
-
-    def test_encode_user_string(self) -> None:
-        arg = "Testing1"
-        cls = AString
-        obj = AString(arg)
-        chk = obj.encode("utf-8")
-        if isinstance(chk, bytes) is False:
-            cls = AStringPatched
-            obj = AStringPatched(arg)
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                obj = cls(v.b64_str_wrapped)
-                ret = obj.encode(NAME)
-                self.assertEqual(
-                    ret,
-                    v.obj_bytes,
-                    msg=f"""
+"""),
+        )
+
+    def _check_encode_user_string(self, v: Values) -> None:
+        obj = USER_STRING_CLS(v.b64_str_wrapped)
+        ret = obj.encode(NAME)
+        self.assertEqual(
+            ret,
+            v.obj_bytes,
+            msg=LazyMsg(lambda: f"""
 
 {obj!r}).encode({NAME!r})
 
@@ -208,18 +205,20 @@ expected: {v.obj_bytes!r}
 
      got: {ret!r}
 
-""",
-                )
-
-    def test_end_to_end(self) -> None:
-        for v in TEST_VALUES:
-            with self.subTest(v=v):
-                b64_str = v.obj_bytes.decode(NAME)
-                obj_bytes = b64_str.encode(NAME)
-                ret = pickle.loads(obj_bytes)
-                self.assertEqual(
-                    ret, v.obj, msg=f"\n\nexpected: {v.obj!r}\n\n     got: {ret!r}\n\n"
-                )
+"""),
+        )
+
+    def _check_end_to_end(self, v: Values) -> None:
+        b64_str = v.obj_bytes.decode(NAME)
+        obj_bytes = b64_str.encode(NAME)
+        ret = marshal.loads(obj_bytes)
+        self.assertEqual(
+            ret,
+            v.obj,
+            msg=LazyMsg(
+                lambda: f"\n\nexpected: {v.obj!r}\n\n     got: {ret!r}\n\n"
+            ),
+        )
 
     def test_raises_unicode_encode_error(self) -> None:
         val = "{foo}"
@@ -1,8 +1,8 @@
 import unittest
 from collections import UserString
 from typing import NamedTuple, Tuple
-from flutils.codecs import register_codecs
 from flutils.codecs.raw_utf8_escape import NAME, _get_codec_info, decode, encode
+from . import LazyMsg, setup_codecs
 
 
 class Values(NamedTuple):
@@ -16,14 +16,26 @@ TEST_VALUES: Tuple[Values, ...] = (
     Values("Test", b"Test", 4, 4),
     Values(
         "1.★ 2.☆ 3.⭐︎ 4.✩ 5.✪ 6.✫7.✭ 8.✮ 9.🇺🇸 10.🇾🇹 11.🛑",
-        b"1.\\xe2\\x98\\x85 2.\\xe2\\x98\\x86 3.\\xe2\\xad\\x90\\xef\\xb8\\x8e 4.\\xe2\\x9c\\xa9 5.\\xe2\\x9c\\xaa 6.\\xe2\\x9c\\xab7.\\xe2\\x9c\\xad 8.\\xe2\\x9c\\xae 9.\\xf0\\x9f\\x87\\xba\\xf0\\x9f\\x87\\xb8 10.\\xf0\\x9f\\x87\\xbe\\xf0\\x9f\\x87\\xb9 11.\\xf0\\x9f\\x9b\\x91",
+        # The escaped UTF-8 of the text above, i.e. b"1.\\xe2\\x98\\x85 2...".
+        bytes.fromhex(
+            "312e5c7865325c7839385c78383520322e5c7865325c7839385c78383620332e"
+            "5c7865325c7861645c7839305c7865665c7862385c78386520342e5c7865325c"
+            "7839635c78613920352e5c7865325c7839635c78616120362e5c7865325c7839"
+            "635c786162372e5c7865325c7839635c78616420382e5c7865325c7839635c78"
+            "616520392e5c7866305c7839665c7838375c7862615c7866305c7839665c7838"
+            "375c7862382031302e5c7866305c7839665c7838375c7862655c7866305c7839"
+            "665c7838375c7862392031312e5c7866305c7839665c7839625c783931"
+        ),
         47,
         221,
     ),
     Values("Te\\st★", b"Te\\st\\xe2\\x98\\x85", 6, 17),
     Values("☆⭐︎", b"\\xe2\\x98\\x86\\xe2\\xad\\x90\\xef\\xb8\\x8e", 3, 36),
 )
-register_codecs()
+
+
+def setUpModule() -> None:
+    setup_codecs()
 
 
 class AString(UserString):
@@ -36,6 +48,28 @@ class AStringPatched(UserString):
         return self.data.encode(*args, **kwargs)
 
 
+# Some Python versions have a UserString.encode that does not return
+# bytes; probe that once with an ASCII-only value.
+USER_STRING_CLS = AString
+if isinstance(AString("Testing1").encode("ascii"), bytes) is False:
+    USER_STRING_CLS = AStringPatched
+
+
+_ENCODE_MSG = (
+    "\n\nencode({arg!r})[{index}]\n\nexpected: {exp!r}\n\n     got: {got!r}\n\n"
+)
+_DECODE_MSG = (
+    "\n\ndecode({arg!r})[{index}]\n\nexpected: {exp!r}\n\n     got: {got!r}\n\n"
+)
+_REGISTERED_MSG = (
+    "\n\n{arg!r}.{method}(%r)\n\nexpected: {exp!r}\n\n     got: {got!r}\n\n" % NAME
+)
+_USER_STRING_MSG = (
+    "\n\n{arg!r}.encode(%r)\n\nexpected: {exp!r}\n\n     got: {got!r}\n\n"
+    "    type: {ret_type}\n\n" % NAME
+)
+
+
 class TestRawUtf8Escape(unittest.TestCase):
 
     def test_encode_value_bytes(self) -> None:
@@ -44,15 +78,10 @@ class TestRawUtf8Escape(unittest.TestCase):
             self.assertEqual(
                 ret,
                 v.txt_bytes,
-                msg=f"""
-
-encode({v.txt_str!r})[0]
-
-expected: {v.txt_bytes!r}
-
-     got: {ret!r}
-
-""",
+                msg=LazyMsg(
+                    _ENCODE_MSG.format_map,
+                    dict(arg=v.txt_str, index=0, exp=v.txt_bytes, got=ret),
+                ),
             )
 
     def test_encode_consumed_value(self) -> None:
@@ -61,15 +90,10 @@ expected: {v.txt_bytes!r}
             self.assertEqual(
                 ret,
                 v.txt_str_len,
-                msg=f"""
-
-encode({v.txt_str!r})[1]
-
-expected: {v.txt_str_len!r}
-
-     got: {ret!r}
-
-""",
+                msg=LazyMsg(
+                    _ENCODE_MSG.format_map,
+                    dict(arg=v.txt_str, index=1, exp=v.txt_str_len, got=ret),
+                ),
             )
 
     def test_encode_raises_unicode_encode_error(self) -> None:
@@ -82,15 +106,10 @@ expected: {v.txt_str_len!r}
             self.assertEqual(
                 ret,
                 v.txt_str,
-                msg=f"""
-
-decode({v.txt_bytes!r})[0]
-
-expected: {v.txt_str!r}
-
-     got: {ret!r}
-
-""",
+                msg=LazyMsg(
+                    _DECODE_MSG.format_map,
+                    dict(arg=v.txt_bytes, index=0, exp=v.txt_str, got=ret),
+                ),
             )
 
     def test_decode_consumed_value(self) -> None:
@@ -99,15 +118,10 @@ expected: {v.txt_str!r}
             self.assertEqual(
                 ret,
                 v.txt_bytes_len,
-                msg=f"""
-
-decode({v.txt_bytes!r})[1]
-
-expected: {v.txt_bytes_len!r}
-
-     got: {ret!r}
-
-""",
+                msg=LazyMsg(
+                    _DECODE_MSG.format_map,
+                    dict(arg=v.txt_bytes, index=1, exp=v.txt_bytes_len, got=ret),
+                ),
             )
 
     def test_encode_raises_unicode_decode_error(self) -> None:
@@ -120,15 +134,10 @@ expected: {v.txt_bytes_len!r}
             self.assertEqual(
                 ret,
                 v.txt_bytes,
-                msg=f"""
-
-{v.txt_str!r}.encode({NAME!r})
-
-expected: {v.txt_bytes!r}
-
-     got: {ret!r}
-
-""",
+                msg=LazyMsg(
+                    _REGISTERED_MSG.format_map,
+                    dict(arg=v.txt_str, method="encode", exp=v.txt_bytes, got=ret),
+                ),
             )
 
     def test_registered_decode_value(self) -> None:
@@ -137,40 +146,25 @@ expected: {v.txt_bytes!r}
             self.assertEqual(
                 ret,
                 v.txt_str,
-                msg=f"""
-
-{v.txt_bytes!r}.decode({NAME!r})
-
-expected: {v.txt_str!r}
-
-     got: {ret!r}
-
-""",
+                msg=LazyMsg(
+                    _REGISTERED_MSG.format_map,
+                    dict(arg=v.txt_bytes, method="decode", exp=v.txt_str, got=ret),
+                ),
             )
 
     def test_encode_user_string(self) -> None:
         arg = "Testing1"
-        obj = AString(arg)
-        chk = obj.encode("utf-8")
-        if isinstance(chk, bytes) is False:
-            obj = AStringPatched(arg)
+        obj = USER_STRING_CLS(arg)
         exp = b"Testing1"
         ret = obj.encode(NAME)
         ret_type = type(ret).__name__
         self.assertEqual(
             ret,
             exp,
-            msg=f"""
-
-{arg!r}.encode({NAME!r})
-
-expected: {exp!r}
-
-     got: {ret!r}
-
-    type: {ret_type}
-
-""",
+            msg=LazyMsg(
+                _USER_STRING_MSG.format_map,
+                dict(arg=arg, exp=exp, got=ret, ret_type=ret_type),
+            ),
         )
 
     def test_get_codec_info(self) -> None:
@@ -13,20 +13,21 @@ PATH = os.path.join(
 )
 ENCODING = getpreferredencoding() or getdefaultencoding()
 GREP = shutil.which("grep")
+EXPECTED_LS_FLAP = tuple(shlex.split("ls -flap"))
 
 
 class TestPrepCmd(unittest.TestCase):
 
     def test_bytes(self) -> None:
         arg = b"ls -flap"
-        exp = tuple(shlex.split(arg.decode("utf-8")))
+        exp = EXPECTED_LS_FLAP
         got = prep_cmd(arg)
         msg = f"\n\nflutils.cmdutils.prep_cmd({arg!r})\n\nexp = {exp!r}got = {got!r}"
         self.assertEqual(got, exp, msg=msg)
 
     def test_str(self) -> None:
         arg = "ls -flap"
-        exp = tuple(shlex.split(arg))
+        exp = EXPECTED_LS_FLAP
         got = prep_cmd(arg)
         msg = f"\n\nflutils.cmdutils.prep_cmd({arg!r})\n\nexp = {exp!r}got = {got!r}"
         self.assertEqual(got, exp, msg=msg)
@@ -63,6 +64,16 @@ class Kwargs(NamedTuple):
 
 class TestRunCmdClass(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Shared by the tests that only call it; tests that check
+        # construction or raise_error build their own instance.
+        cls.rc_default = RunCmd(stderr=PIPE, stdout=PIPE)
+        # Run ``ls`` once for all of the tests that inspect its result.
+        cwd = shlex.quote(os.path.abspath(os.getcwd()))
+        cls.ls_cmd = f"ls {cwd}"
+        cls.ls_result = cls.rc_default(cls.ls_cmd)
+
     def test_init_raise_error_value(self) -> None:
         rc = RunCmd(raise_error=False, output_encoding=1)
         msg = f"""
@@ -115,10 +126,8 @@ exp: {exp!r}
         self.assertEqual(rc.output_encoding, exp, msg=msg)
 
     def test_call_return_code(self) -> None:
-        rc = RunCmd(stderr=PIPE, stdout=PIPE)
-        cwd = shlex.quote(os.path.abspath(os.getcwd()))
-        cmd = f"ls {cwd}"
-        res = rc(cmd)
+        cmd = self.ls_cmd
+        res = self.ls_result
         exp = 0
         msg = f"""
 
@@ -134,10 +143,8 @@ exp: {exp!r}
         self.assertEqual(res.return_code, exp, msg=msg)
 
     def test_call_stdout(self) -> None:
-        rc = RunCmd(stderr=PIPE, stdout=PIPE)
-        cwd = shlex.quote(os.path.abspath(os.getcwd()))
-        cmd = f"ls {cwd}"
-        res = rc(cmd)
+        cmd = self.ls_cmd
+        res = self.ls_result
         exp = 0
         msg = f"""
 
@@ -94,6 +94,10 @@ class TestHasAnyCallables(unittest.TestCase):
         obj = dict(a=1, b=2)
         self.assertFalse(has_any_callables(obj, "foo", "bar"))
 
+    def test_integration_has_any_callables_missing_first(self):
+        obj = dict(a=1, b=2)
+        self.assertTrue(has_any_callables(obj, "foo", "get"))
+
 
 class TestIsSubclassOfAny(unittest.TestCase):
 
@@ -1,11 +1,108 @@
 import unittest
 from flutils.txtutils import AnsiTextWrapper, len_without_ansi
 
+from . import LazyMsg
+
 
 def _build_msg(expected: str, got: str) -> str:
     return "\n\n<Expected:>\n%s\n<Got:>\n%s\n<End>\n" % (expected, got)
 
 
+_LOREM = """Lorem ipsum dolor sit amet, consectetur
+adipiscing elit. Cras fermentum maximus
+auctor. Cras a varius ligula. Phasellus
+ut ipsum eu erat consequat posuere.
+Pellentesque habitant morbi tristique
+senectus et netus et malesuada fames ac
+turpis egestas. Maecenas ultricies lacus
+id massa interdum dignissim. Curabitur
+efficitur ante sit amet nibh
+consectetur, consequat rutrum nunc
+egestas. Duis mattis arcu eget orci
+euismod, sit amet vulputate ante
+scelerisque. Aliquam ultrices, turpis id
+gravida vestibulum, tortor ipsum
+consequat mauris, eu cursus nisi felis
+at felis. Quisque blandit lacus nec
+mattis suscipit. Proin sed tortor ante.
+Praesent fermentum orci id dolor
+euismod, quis auctor nisl sodales."""
+_LOREM_ARG = _LOREM.replace("\n", " ")
+
+
+_LOREM_INDENTED = """   Lorem ipsum dolor sit amet, consectetur
+  adipiscing elit.Cras fermentum maximus
+  auctor.Cras a varius ligula.Phasellus ut
+  ipsum eu erat consequat posuere.
+  Pellentesque habitant morbi tristique
+  senectus et netus et malesuada fames ac
+  turpis egestas.Maecenas ultricies lacus id
+  massa interdum dignissim.Curabitur
+  efficitur ante sit amet nibh consectetur,
+  consequat rutrum nunc egestas.Duis mattis
+  arcu eget orci euismod, sit amet vulputate
+  ante scelerisque.Aliquam ultrices, turpis
+  id gravida vestibulum, tortor ipsum
+  consequat mauris, eu cursus nisi felis at
+  felis.Quisque blandit lacus nec mattis
+  suscipit.Proin sed tortor ante.Praesent
+  fermentum orci id dolor euismod, quis
+  auctor nisl sodales."""
+_LOREM_INDENTED_ARG = " ".join(map(str.lstrip, _LOREM_INDENTED.splitlines()))
+
+
+_LOREM_5_LINES = """Lorem ipsum dolor sit amet, consectetur
+adipiscing elit. Cras fermentum maximus
+auctor. Cras a varius ligula. Phasellus
+ut ipsum eu erat consequat posuere.
+Pellentesque habitant morbi tristique"""
+_LOREM_5_LINES_ARG = _LOREM_5_LINES.replace("\n", " ")
+
+
+_LOREM_ANSI_ALL = """[31mLorem ipsum dolor sit amet, consectetur
+adipiscing elit. Cras fermentum maximus
+auctor. Cras a varius ligula. Phasellus
+ut ipsum eu erat consequat posuere.
+Pellentesque habitant morbi tristique
+senectus et netus et malesuada fames ac
+turpis egestas. Maecenas ultricies lacus
+id massa interdum dignissim. Curabitur
+efficitur ante sit amet nibh
+consectetur, consequat rutrum nunc
+egestas. Duis mattis arcu eget orci
+euismod, sit amet vulputate ante
+scelerisque. Aliquam ultrices, turpis id
+gravida vestibulum, tortor ipsum
+consequat mauris, eu cursus nisi felis
+at felis. Quisque blandit lacus nec
+mattis suscipit. Proin sed tortor ante.
+Praesent fermentum orci id dolor
+euismod, quis auctor nisl sodales.[0m"""
+_LOREM_ANSI_ALL_ARG = _LOREM_ANSI_ALL.replace("\n", " ")
+
+
+_LOREM_ANSI_MIXED = """[31m[1m[4mLorem ipsum dolor sit amet, consectetur
+adipiscing elit. Cras fermentum maximus
+auctor. Cras a varius ligula. Phasellus
+ut ipsum eu erat consequat posuere.[0m
+Pellentesque habitant morbi tristique
+senectus et netus et malesuada fames ac
+turpis egestas. Maecenas ultricies lacus
+id massa interdum dignissim. Curabitur[38;2;55;172;230m
+efficitur ante sit amet nibh
+consectetur, consequat rutrum nunc[0m
+egestas. Duis mattis arcu eget orci
+euismod, sit amet vulputate ante
+scelerisque. Aliquam ultrices, turpis id
+gravida vestibulum, tortor ipsum
+consequat mauris, eu cursus nisi felis
+at felis. Quisque blandit lacus nec
+mattis suscipit. Proin sed tortor ante.
+Praesent fermentum orci id dolor[38;5;208m
+euismod, quis auctor nisl sodales.[0m"""
+_LOREM_ANSI_MIXED_ARG = _LOREM_ANSI_MIXED.replace("\n", " ")
+
+
 class TestTextUtilsLenWithoutAnsi(unittest.TestCase):
 
     def test_list_with_ansi(self) -> None:
@@ -116,58 +213,20 @@ class TestTextUtilsAnsiTextWrapper(unittest.TestCase):
         self.assertEqual(obj.placeholder_len, 0)
 
     def test_width_40(self) -> None:
-        exp = """Lorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor
-euismod, quis auctor nisl sodales."""
-        arg = exp.replace("\n", " ")
+        exp = _LOREM
+        arg = _LOREM_ARG
         wrapper = AnsiTextWrapper(width=40)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_width_44_with_indent(self) -> None:
-        exp = """   Lorem ipsum dolor sit amet, consectetur
-  adipiscing elit.Cras fermentum maximus
-  auctor.Cras a varius ligula.Phasellus ut
-  ipsum eu erat consequat posuere.
-  Pellentesque habitant morbi tristique
-  senectus et netus et malesuada fames ac
-  turpis egestas.Maecenas ultricies lacus id
-  massa interdum dignissim.Curabitur
-  efficitur ante sit amet nibh consectetur,
-  consequat rutrum nunc egestas.Duis mattis
-  arcu eget orci euismod, sit amet vulputate
-  ante scelerisque.Aliquam ultrices, turpis
-  id gravida vestibulum, tortor ipsum
-  consequat mauris, eu cursus nisi felis at
-  felis.Quisque blandit lacus nec mattis
-  suscipit.Proin sed tortor ante.Praesent
-  fermentum orci id dolor euismod, quis
-  auctor nisl sodales."""
-        arg = "\n".join(map(lambda x: x.lstrip(), exp.splitlines()))
-        arg = arg.replace("\n", " ")
+        exp = _LOREM_INDENTED
+        arg = _LOREM_INDENTED_ARG
         wrapper = AnsiTextWrapper(
             width=44, initial_indent="   ", subsequent_indent="  "
         )
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_width_0_raises(self) -> None:
         with self.assertRaises(ValueError):
@@ -180,45 +239,20 @@ euismod, quis auctor nisl sodales."""
             wrapper.fill("foo bar foo bar")
 
     def test_max_lines_of_5(self) -> None:
-        exp = """Lorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.
-Pellentesque habitant morbi tristique"""
-        arg = exp.replace("\n", " ")
+        exp = _LOREM_5_LINES
+        arg = _LOREM_5_LINES_ARG
         wrapper = AnsiTextWrapper(width=40, max_lines=5)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_max_lines_of_3_with_placeholder(self) -> None:
-        text = """Lorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor
-euismod, quis auctor nisl sodales."""
-        arg = text.replace("\n", " ")
+        arg = _LOREM_ARG
         exp = """Lorem ipsum dolor sit amet, consectetur
 adipiscing elit. Cras fermentum maximus
 .................................."""
         wrapper = AnsiTextWrapper(width=40, max_lines=3, placeholder="." * 34)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_max_lines_of_3_placeholder_with_long_word(self) -> None:
         text = """Lorem ipsum dolor sit amet, consectetur
@@ -229,30 +263,23 @@ senectus et netus et malesuada fames ac"""
         exp = "Lorem ipsum dolor sit amet, consectetur\nadipiscing elit. Cras fermentum [...]"
         wrapper = AnsiTextWrapper(width=40, max_lines=3)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
+
+    def test_max_lines_of_2_with_blank_placeholder(self) -> None:
+        arg = "supercalifragilistic    \t alpha"
+        exp = "> supercalif\n- ragilistic   "
+        wrapper = AnsiTextWrapper(
+            width=12,
+            max_lines=2,
+            placeholder="   ",
+            initial_indent="> ",
+            subsequent_indent="- ",
+        )
+        res = wrapper.fill(arg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_max_lines_of_five_with_placeholder(self) -> None:
-        text = """Lorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor
-euismod, quis auctor nisl sodales."""
-        arg = text.replace("\n", " ")
+        arg = _LOREM_ARG
         exp = """Lorem ipsum dolor sit amet, consectetur
 adipiscing elit. Cras fermentum maximus
 auctor. Cras a varius ligula. Phasellus
@@ -260,8 +287,7 @@ ut ipsum eu erat consequat posuere.
 Pellentesque habitant morbi [...]"""
         wrapper = AnsiTextWrapper(width=40, max_lines=5)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_large_word(self) -> None:
         arg = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Cras fermentum maximus auctor. Cras a varius ligula. Phasellus ut ipsum eu erat consequat posuere. Duis Pellentesquehabitantmorbitristiquesenectusetnetusetmalesuadafamesacblandit turpis egestas. Maecenas ultricies lacus id massa interdum dignissim. Curabitur efficitur ante sit amet nibh consectetur, consequat rutrum nunc egestas. Duis mattis arcu eget orci euismod, sit amet vulputate ante scelerisque. Aliquam ultrices, turpis id gravida vestibulum, tortor ipsum consequat mauris, eu cursus nisi felis at felis. Quisque blandit lacus nec mattis suscipit. Proin sed tortor ante. Praesent fermentum orci id dolor euismod, quis auctor nisl sodales."
@@ -286,81 +312,23 @@ Praesent fermentum orci id dolor
 euismod, quis auctor nisl sodales."""
         wrapper = AnsiTextWrapper(width=40)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_width_40_ansi_all(self) -> None:
-        exp = """[31mLorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor
-euismod, quis auctor nisl sodales.[0m"""
-        arg = exp.replace("\n", " ")
+        exp = _LOREM_ANSI_ALL
+        arg = _LOREM_ANSI_ALL_ARG
         wrapper = AnsiTextWrapper(width=40)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_width_40_ansi_mixed(self) -> None:
-        exp = """[31m[1m[4mLorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.[0m
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur[38;2;55;172;230m
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc[0m
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor[38;5;208m
-euismod, quis auctor nisl sodales.[0m"""
-        arg = exp.replace("\n", " ")
+        exp = _LOREM_ANSI_MIXED
+        arg = _LOREM_ANSI_MIXED_ARG
         wrapper = AnsiTextWrapper(width=40)
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_width_40_indent_ansi_mixed(self) -> None:
-        text = """[31m[1m[4mLorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.[0m
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur[38;2;55;172;230m
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc[0m
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor[38;5;208m
-euismod, quis auctor nisl sodales.[0m"""
         initial_indent = "\x1b[47m\x1b[30m...\x1b[0m"
         exp = """[47m[30m...[0m[31m[1m[4mLorem ipsum dolor sit amet,
 [47m[30m...[0mconsectetur adipiscing elit. Cras
@@ -383,41 +351,21 @@ euismod, quis auctor nisl sodales.[0m"""
 [47m[30m...[0mante. Praesent fermentum orci id
 [47m[30m...[0mdolor[38;5;208m euismod, quis auctor nisl
 [47m[30m...[0msodales.[0m"""
-        arg = text.replace("\n", " ")
+        arg = _LOREM_ANSI_MIXED_ARG
         wrapper = AnsiTextWrapper(
             width=40, initial_indent=initial_indent, subsequent_indent=initial_indent
         )
         res = wrapper.fill(arg)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
 
     def test_width_40_indent_ansi_mixed_placeholder(self) -> None:
-        text = """[31m[1m[4mLorem ipsum dolor sit amet, consectetur
-adipiscing elit. Cras fermentum maximus
-auctor. Cras a varius ligula. Phasellus
-ut ipsum eu erat consequat posuere.[0m
-Pellentesque habitant morbi tristique
-senectus et netus et malesuada fames ac
-turpis egestas. Maecenas ultricies lacus
-id massa interdum dignissim. Curabitur[38;2;55;172;230m
-efficitur ante sit amet nibh
-consectetur, consequat rutrum nunc[0m
-egestas. Duis mattis arcu eget orci
-euismod, sit amet vulputate ante
-scelerisque. Aliquam ultrices, turpis id
-gravida vestibulum, tortor ipsum
-consequat mauris, eu cursus nisi felis
-at felis. Quisque blandit lacus nec
-mattis suscipit. Proin sed tortor ante.
-Praesent fermentum orci id dolor[38;5;208m
-euismod, quis auctor nisl sodales.[0m"""
         initial_indent = "\x1b[47m\x1b[30m...\x1b[0m"
         exp = """[47m[30m...[0m[31m[1m[4mLorem ipsum dolor sit amet,
 [47m[30m...[0mconsectetur adipiscing elit. Cras
 [47m[30m...[0mfermentum maximus auctor. Cras a
 [47m[30m...[0mvarius ligula. Phasellus ut ipsum eu
 [47m[30m...[0merat consequat posuere.[0m [31m[...][0m"""
-        arg = text.replace("\n", " ")
+        arg = _LOREM_ANSI_MIXED_ARG
         wrapper = AnsiTextWrapper(
             width=40,
             initial_indent=initial_indent,
@@ -427,5 +375,25 @@ euismod, quis auctor nisl sodales.[0m"""
         )
         res = wrapper.wrap(arg)
         res = "\n".join(res)
-        msg = _build_msg(exp, res)
-        self.assertEqual(exp, res, msg=msg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
+
+    def test_optimal_width_6(self) -> None:
+        exp = "aaa\nbb cc\nddddd"
+        arg = exp.replace("\n", " ")
+        wrapper = AnsiTextWrapper(width=6, optimal=True)
+        res = wrapper.fill(arg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
+
+    def test_optimal_width_6_ansi(self) -> None:
+        exp = "\x1b[31maaa\x1b[0m\nbb cc\nddddd"
+        arg = exp.replace("\n", " ")
+        wrapper = AnsiTextWrapper(width=6, optimal=True)
+        res = wrapper.fill(arg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
+
+    def test_optimal_long_word_falls_back(self) -> None:
+        arg = "abcdefghij xy"
+        exp = AnsiTextWrapper(width=4).fill(arg)
+        wrapper = AnsiTextWrapper(width=4, optimal=True)
+        res = wrapper.fill(arg)
+        self.assertEqual(exp, res, msg=LazyMsg(_build_msg, exp, res))
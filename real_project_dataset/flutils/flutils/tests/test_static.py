@@ -1,16 +1,29 @@
+import os
+import subprocess
 import sys
 import unittest
-from io import BytesIO
-from flutils.cmdutils import run
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MYPY_ARGS = [
+    "mypy",
+    "--sqlite-cache",
+    "--cache-dir=%s" % os.path.join(PROJECT_DIR, ".mypy_cache"),
+    "-p",
+    "flutils",
+]
 
 
 class TestStaticTypes(unittest.TestCase):
 
     def test_static_types(self) -> None:
-        cmd = "mypy -p flutils"
-        with BytesIO() as stdout:
-            return_code = run(cmd, stdout=stdout, stderr=stdout)
-            text: bytes = stdout.getvalue()
+        cmd = " ".join(MYPY_ARGS)
+        result = subprocess.run(
+            MYPY_ARGS,
+            cwd=PROJECT_DIR,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        return_code, text = result.returncode, result.stdout
         if return_code != 0:
             txt = text.decode(sys.getdefaultencoding())
             msg = """
@@ -1,3 +1,4 @@
+import asyncio
 import keyword
 import types
 import unittest
@@ -7,41 +8,42 @@ from unittest.mock import MagicMock, call, patch, sentinel
 from flutils.decorators import cached_property
 
 
-def coroutine_decorator(f):
+class Obj:
 
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        return f(*args, **kwargs)
+    def __init__(self, value):
+        self.value = value
 
-    return wrapper
+    @cached_property
+    def new_value(self):
+        return self.value + 1
 
 
-class Obj:
+class AsyncObj:
 
     def __init__(self, value):
         self.value = value
 
     @cached_property
-    def new_value(self):
+    async def new_value(self):
         return self.value + 1
 
 
 class TestCachedPropertyAsync(unittest.TestCase):
 
     def setUp(self):
-        patcher = patch("asyncio.ensure_future", return_value=5)
-        self.asyncio_ensure_future = patcher.start()
-        self.addCleanup(patcher.stop)
-        patcher = patch("asyncio.coroutine", coroutine_decorator)
-        self.asyncio_coroutine = patcher.start()
-        self.addCleanup(patcher.stop)
-        patcher = patch("asyncio.iscoroutinefunction", return_value=True)
-        self.asyncio_iscoroutinefunction = patcher.start()
-        self.addCleanup(patcher.stop)
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
 
     def test_cached_property_async(self):
-        obj = Obj(4)
-        self.assertEqual(obj.new_value, 5)
+        obj = AsyncObj(4)
+        self.assertEqual(self.loop.run_until_complete(obj.new_value), 5)
+
+    def test_cached_property_async_caches_future(self):
+        obj = AsyncObj(4)
+        self.loop.run_until_complete(obj.new_value)
+        future = obj.__dict__["new_value"]
+        self.assertIs(obj.new_value, future)
+        self.assertEqual(future.result(), 5)
 
 
 class TestCachedPropertyClassProperty(unittest.TestCase):
@@ -1,5 +1,6 @@
+import copy
 import unittest
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 from flutils.pathutils import chmod
 from ..mocks.pathlib import PosixPathMock
 
@@ -44,70 +45,75 @@ class TestChmodDirectory(unittest.TestCase):
 
 class TestChmodGlob(unittest.TestCase):
 
-    def setUp(self):
-        self.file_four = PosixPathMock(
-            "/home/test_user/dir_tmp/dir_sub/file_four", is_file=True
-        )
-        self.dir_sub = PosixPathMock("/home/test_user/dir_tmp/dir_sub", is_dir=True)
-        self.file_three = PosixPathMock(
-            "/home/test_user/dir_tmp/file_three", is_file=True
+    @classmethod
+    def setUpClass(cls):
+        # Never used directly; each test works on shallow copies, which
+        # build their own MagicMock attributes on first access.
+        cls.glob_template = (
+            PosixPathMock("/home/test_user/dir_tmp/dir_sub/file_four", is_file=True),
+            PosixPathMock("/home/test_user/dir_tmp/dir_sub", is_dir=True),
+            PosixPathMock("/home/test_user/dir_tmp/file_three", is_file=True),
+            PosixPathMock("/home/test_user/dir_tmp/fifo_two", is_fifo=True),
+            PosixPathMock("/home/test_user/dir_tmp/file_one", is_file=True),
+            PosixPathMock("/home/test_user/dir_tmp", is_dir=True),
         )
-        self.fifo_two = PosixPathMock("/home/test_user/dir_tmp/fifo_two", is_fifo=True)
-        self.file_one = PosixPathMock("/home/test_user/dir_tmp/file_one", is_file=True)
-        self.dir_tmp = PosixPathMock("/home/test_user/dir_tmp", is_dir=True)
-        self.path = PosixPathMock(
-            "/home/test_user/**",
-            glob=[
-                self.file_four,
-                self.dir_sub,
-                self.file_three,
-                self.fifo_two,
-                self.file_one,
-                self.dir_tmp,
-            ],
+
+    def setUp(self):
+        glob = [copy.copy(path) for path in self.glob_template]
+        (
+            self.file_four,
+            self.dir_sub,
+            self.file_three,
+            self.fifo_two,
+            self.file_one,
+            self.dir_tmp,
+        ) = glob
+        self.path = PosixPathMock("/home/test_user/**", glob=glob)
+        patcher = patch.multiple(
+            "flutils.pathutils", normalize_path=DEFAULT, Path=DEFAULT
         )
-        patcher = patch("flutils.pathutils.normalize_path", return_value=self.path)
-        self.normalize_path = patcher.start()
-        self.addCleanup(patcher.stop)
-        patcher = patch("flutils.pathutils.Path", return_value=self.path)
-        self.path_func = patcher.start()
+        mocks = patcher.start()
         self.addCleanup(patcher.stop)
+        self.normalize_path = mocks["normalize_path"]
+        self.normalize_path.return_value = self.path
+        self.path_func = mocks["Path"]
+        self.path_func.return_value = self.path
+        self.files = []
+        self.dirs = []
+        self.others = []
+        for path in self.path.glob_data:
+            if path.kwargs.get("is_file", False) is True:
+                self.files.append(path)
+            elif path.kwargs.get("is_dir", False) is True:
+                self.dirs.append(path)
+            else:
+                self.others.append(path)
+
+    def assert_chmod_glob_modes(self, mode_file, mode_dir):
+        for path in self.files:
+            path.chmod.assert_called_with(mode_file)
+        for path in self.dirs:
+            path.chmod.assert_called_with(mode_dir)
+        for path in self.others:
+            path.chmod.assert_not_called()
 
     def test_chmod_glob_default(self):
         chmod("~/**")
         self.normalize_path.assert_called_with("~/**")
         self.path.glob.assert_called_with("/home/test_user/**")
-        for path in self.path.glob_data:
-            if path.kwargs.get("is_file", False) is True:
-                path.chmod.assert_called_with(384)
-            elif path.kwargs.get("is_dir", False) is True:
-                path.chmod.assert_called_with(448)
-            elif path.kwargs.get("is_fifo", False) is True:
-                path.chmod.assert_not_called()
+        self.assert_chmod_glob_modes(384, 448)
 
     def test_chmod_glob_modes(self):
         chmod("~/**", mode_file=432, mode_dir=504)
         self.normalize_path.assert_called_with("~/**")
         self.path.glob.assert_called_with("/home/test_user/**")
-        for path in self.path.glob_data:
-            if path.kwargs.get("is_file", False) is True:
-                path.chmod.assert_called_with(432)
-            elif path.kwargs.get("is_dir", False) is True:
-                path.chmod.assert_called_with(504)
-            elif path.kwargs.get("is_fifo", False) is True:
-                path.chmod.assert_not_called()
+        self.assert_chmod_glob_modes(432, 504)
 
     def test_chmod_glob_include_parent(self):
         chmod("~/**", mode_file=432, mode_dir=504, include_parent=True)
         self.normalize_path.assert_called_with("~/**")
         self.path.glob.assert_called_with("/home/test_user/**")
-        for path in self.path.glob_data:
-            if path.kwargs.get("is_file", False) is True:
-                path.chmod.assert_called_with(432)
-            elif path.kwargs.get("is_dir", False) is True:
-                path.chmod.assert_called_with(504)
-            elif path.kwargs.get("is_fifo", False) is True:
-                path.chmod.assert_not_called()
+        self.assert_chmod_glob_modes(432, 504)
         self.path.parent.is_dir.assert_called()
         self.path.parent.chmod.assert_called_with(504)
 
@@ -116,12 +122,15 @@ class TestChmodEmptyGlob(unittest.TestCase):
 
     def setUp(self):
         self.path = PosixPathMock("/home/test_user/**")
-        patcher = patch("flutils.pathutils.normalize_path", return_value=self.path)
-        self.normalize_path = patcher.start()
-        self.addCleanup(patcher.stop)
-        patcher = patch("flutils.pathutils.Path", return_value=self.path)
-        self.path_func = patcher.start()
+        patcher = patch.multiple(
+            "flutils.pathutils", normalize_path=DEFAULT, Path=DEFAULT
+        )
+        mocks = patcher.start()
         self.addCleanup(patcher.stop)
+        self.normalize_path = mocks["normalize_path"]
+        self.normalize_path.return_value = self.path
+        self.path_func = mocks["Path"]
+        self.path_func.return_value = self.path
 
     def test_chmod_empty_glob(self):
         chmod("~/**", mode_file=432, mode_dir=504, include_parent=True)
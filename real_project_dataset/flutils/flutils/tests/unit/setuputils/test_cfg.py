@@ -1,13 +1,17 @@
+import os
+import tempfile
 import unittest
 from configparser import ConfigParser, NoOptionError, NoSectionError
 from typing import List
-from unittest.mock import Mock, PropertyMock, patch
+from unittest.mock import Mock, patch
 from flutils.setuputils.cfg import (
     SetupCfgCommandConfig,
     _each_setup_cfg_command,
     _each_setup_cfg_command_section,
     _get_name,
+    _parse_cfg,
     _prep_setup_dir,
+    _read_cfg,
     _validate_setup_dir,
     each_sub_command_config,
 )
@@ -235,10 +239,9 @@ expected: {exp!r}
             )
 
     def test_prep_setup_dir__1(self) -> None:
-        frame_summary = Mock()
-        type(frame_summary).filename = PropertyMock(return_value="/a/dir/path/setup.py")
         patcher = patch(
-            "flutils.setuputils.cfg.extract_stack", return_value=[frame_summary]
+            "flutils.setuputils.cfg._stack_filenames",
+            return_value=["/a/dir/path/setup.py"],
         )
         patcher.start()
         self.addCleanup(patcher.stop)
@@ -253,10 +256,8 @@ expected: {exp!r}
         self.assertEqual(ret, exp)
 
     def test_prep_setup_dir__2(self) -> None:
-        frame_summary = Mock()
-        type(frame_summary).filename = PropertyMock(return_value="/a/dir/path/a.py")
         patcher = patch(
-            "flutils.setuputils.cfg.extract_stack", return_value=[frame_summary]
+            "flutils.setuputils.cfg._stack_filenames", return_value=["/a/dir/path/a.py"]
         )
         patcher.start()
         self.addCleanup(patcher.stop)
@@ -336,3 +337,61 @@ However it was called {ret} time(s).
             ),
         )
         each_setup_cfg_command.assert_called()
+
+    def test_parse_cfg__0(self) -> None:
+        text = """# a comment
+[metadata]
+Name = raijin
+
+[setup.command.lint]
+description: Verify {name}
+commands =
+    linter {setup_dir}
+
+    ; skipped
+    styler {setup_dir}
+"""
+        parser = ConfigParser()
+        parser.read_string(text)
+        exp = {
+            section: dict(parser.items(section, raw=True))
+            for section in parser.sections()
+        }
+        ret = _parse_cfg(text)
+        self.assertEqual(
+            ret,
+            exp,
+            msg="""
+
+_parse_cfg(text)
+expected: {exp!r}
+     got: {ret!r}
+""".format(
+                exp=exp, ret=ret
+            ),
+        )
+
+    def test_parse_cfg__1(self) -> None:
+        for text in (
+            "name = raijin\n",
+            "[DEFAULT]\nname = raijin\n",
+            "[metadata]\nname = raijin\n[metadata]\n",
+            "[metadata]\nname = raijin\nNAME = raijin\n",
+            "[metadata]\nname\n",
+            "[metadata]\nname = %(home)s\n",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(_parse_cfg(text))
+
+    def test_read_cfg__0(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "setup.cfg")
+            with open(path, "w") as f:
+                f.write("[metadata]\nname = raijin\n")
+            first = _read_cfg(path)
+            first.set("metadata", "name", "changed")
+            first.add_section("extra")
+            second = _read_cfg(path)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.get("metadata", "name"), "raijin")
+        self.assertFalse(second.has_section("extra"))
@@ -8,6 +8,8 @@ and maintain connections.
 
 import os.path
 import socket
+import stat
+import threading
 import typing
 import warnings
 from urllib3.exceptions import ClosedPoolError, ConnectTimeoutError
@@ -68,15 +70,76 @@ DEFAULT_POOLBLOCK = False
 DEFAULT_POOLSIZE = 10
 DEFAULT_RETRIES = 0
 DEFAULT_POOL_TIMEOUT = None
-try:
-    import ssl
+_preloaded_ssl_context = None
+_preloaded_ssl_context_ready = False
+_preloaded_ssl_context_lock = threading.Lock()
+
+
+def _get_preloaded_ssl_context():
+    global _preloaded_ssl_context, _preloaded_ssl_context_ready
+    if not _preloaded_ssl_context_ready:
+        with _preloaded_ssl_context_lock:
+            if not _preloaded_ssl_context_ready:
+                try:
+                    import ssl
+
+                    context = create_urllib3_context()
+                    context.load_verify_locations(
+                        extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH)
+                    )
+                except (ImportError, OSError):
+                    context = None
+                _preloaded_ssl_context = context
+                _preloaded_ssl_context_ready = True
+    return _preloaded_ssl_context
+
+
+def _timeout_from_tuple(timeout):
+    try:
+        connect, read = timeout
+        return TimeoutSauce(connect=connect, read=read)
+    except ValueError:
+        raise ValueError(
+            f"Invalid timeout {timeout}. Pass a (connect, read) timeout tuple, or a single float to set both timeouts to the same value."
+        )
+
+
+def _timeout_from_sauce(timeout):
+    return timeout
+
+
+def _timeout_from_scalar(timeout):
+    return TimeoutSauce(connect=timeout, read=timeout)
 
-    _preloaded_ssl_context = create_urllib3_context()
-    _preloaded_ssl_context.load_verify_locations(
-        extract_zipped_paths(DEFAULT_CA_BUNDLE_PATH)
-    )
-except ImportError:
-    _preloaded_ssl_context = None
+
+def _timeout_from_any(timeout):
+    if isinstance(timeout, tuple):
+        return _timeout_from_tuple(timeout)
+    elif isinstance(timeout, TimeoutSauce):
+        return timeout
+    return _timeout_from_scalar(timeout)
+
+
+_TIMEOUT_HANDLERS = {
+    tuple: _timeout_from_tuple,
+    TimeoutSauce: _timeout_from_sauce,
+    int: _timeout_from_scalar,
+    float: _timeout_from_scalar,
+    type(None): _timeout_from_scalar,
+}
+
+
+def _url_scheme(url):
+    scheme, sep, rest = url.partition(":")
+    if (
+        sep
+        and rest.startswith("//")
+        and scheme.isascii()
+        and scheme.isalnum()
+        and scheme[0].isalpha()
+    ):
+        return scheme.lower()
+    return urlparse(url).scheme.lower()
 
 
 def _urllib3_request_context(
@@ -92,14 +155,13 @@ def _urllib3_request_context(
     port = parsed_request_url.port
     poolmanager_kwargs = getattr(poolmanager, "connection_pool_kw", {})
     has_poolmanager_ssl_context = poolmanager_kwargs.get("ssl_context")
-    should_use_default_ssl_context = (
-        _preloaded_ssl_context is not None and not has_poolmanager_ssl_context
-    )
     cert_reqs = "CERT_REQUIRED"
     if verify is False:
         cert_reqs = "CERT_NONE"
-    elif verify is True and should_use_default_ssl_context:
-        pool_kwargs["ssl_context"] = _preloaded_ssl_context
+    elif verify is True and not has_poolmanager_ssl_context:
+        preloaded_ssl_context = _get_preloaded_ssl_context()
+        if preloaded_ssl_context is not None:
+            pool_kwargs["ssl_context"] = preloaded_ssl_context
     elif isinstance(verify, str):
         if not os.path.isdir(verify):
             pool_kwargs["ca_certs"] = verify
@@ -152,6 +214,7 @@ class HTTPAdapter(BaseAdapter):
             self.max_retries = Retry.from_int(max_retries)
         self.config = {}
         self.proxy_manager = {}
+        self._path_cache = {}
         super().__init__()
         self._pool_connections = pool_connections
         self._pool_maxsize = pool_maxsize
@@ -163,6 +226,7 @@ class HTTPAdapter(BaseAdapter):
 
     def __setstate__(self, state):
         self.proxy_manager = {}
+        self._path_cache = {}
         self.config = {}
         for attr, value in state.items():
             setattr(self, attr, value)
@@ -206,16 +270,29 @@ class HTTPAdapter(BaseAdapter):
             )
         return manager
 
+    def _path_lookup(self, path):
+        try:
+            return self._path_cache[path]
+        except KeyError:
+            pass
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
+            return False, False
+        result = self._path_cache[path] = (True, stat.S_ISDIR(mode))
+        return result
+
     def cert_verify(self, conn, url, verify, cert):
         if url.lower().startswith("https") and verify:
             conn.cert_reqs = "CERT_REQUIRED"
             if verify is not True:
                 cert_loc = verify
-                if not os.path.exists(cert_loc):
+                exists, isdir = self._path_lookup(cert_loc)
+                if not exists:
                     raise OSError(
                         f"Could not find a suitable TLS CA certificate bundle, invalid path: {cert_loc}"
                     )
-                if not os.path.isdir(cert_loc):
+                if not isdir:
                     conn.ca_certs = cert_loc
                 else:
                     conn.ca_cert_dir = cert_loc
@@ -230,11 +307,11 @@ class HTTPAdapter(BaseAdapter):
             else:
                 conn.cert_file = cert
                 conn.key_file = None
-            if conn.cert_file and not os.path.exists(conn.cert_file):
+            if conn.cert_file and not self._path_lookup(conn.cert_file)[0]:
                 raise OSError(
                     f"Could not find the TLS certificate file, invalid path: {conn.cert_file}"
                 )
-            if conn.key_file and not os.path.exists(conn.key_file):
+            if conn.key_file and not self._path_lookup(conn.key_file)[0]:
                 raise OSError(
                     f"Could not find the TLS key file, invalid path: {conn.key_file}"
                 )
@@ -311,11 +388,11 @@ class HTTPAdapter(BaseAdapter):
 
     def request_url(self, request, proxies):
         proxy = select_proxy(request.url, proxies)
-        scheme = urlparse(request.url).scheme
+        scheme = _url_scheme(request.url)
         is_proxied_http_request = proxy and scheme != "https"
         using_socks_proxy = False
         if proxy:
-            proxy_scheme = urlparse(proxy).scheme.lower()
+            proxy_scheme = _url_scheme(proxy)
             using_socks_proxy = proxy_scheme.startswith("socks")
         url = request.path_url
         if url.startswith("//"):
@@ -354,18 +431,7 @@ class HTTPAdapter(BaseAdapter):
             proxies=proxies,
         )
         chunked = not (request.body is None or "Content-Length" in request.headers)
-        if isinstance(timeout, tuple):
-            try:
-                connect, read = timeout
-                timeout = TimeoutSauce(connect=connect, read=read)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid timeout {timeout}. Pass a (connect, read) timeout tuple, or a single float to set both timeouts to the same value."
-                )
-        elif isinstance(timeout, TimeoutSauce):
-            pass
-        else:
-            timeout = TimeoutSauce(connect=timeout, read=timeout)
+        timeout = _TIMEOUT_HANDLERS.get(type(timeout), _timeout_from_any)(timeout)
         try:
             resp = conn.urlopen(
                 method=request.method,
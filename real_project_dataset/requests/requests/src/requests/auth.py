@@ -8,17 +8,42 @@ This module contains the authentication handlers for Requests.
 import hashlib
 import os
 import re
+import sys
 import threading
-import time
 import warnings
 from base64 import b64encode
-from ._internal_utils import to_native_string
+from functools import lru_cache
 from .compat import basestring, str, urlparse
 from .cookies import extract_cookies_to_jar
 from .utils import parse_dict_header
 
 CONTENT_TYPE_FORM_URLENCODED = "application/x-www-form-urlencoded"
 CONTENT_TYPE_MULTI_PART = "multipart/form-data"
+_DIGEST_PREFIX_RE = re.compile("digest ", flags=re.IGNORECASE)
+_HASH_KWARGS = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+
+
+def _make_hash_utf8(hash_func):
+    def hash_utf8(x):
+        if isinstance(x, str):
+            x = x.encode("utf-8")
+        return hash_func(x, **_HASH_KWARGS).hexdigest()
+
+    return hash_utf8
+
+
+_DIGEST_HASH_UTF8 = {
+    "MD5": _make_hash_utf8(hashlib.md5),
+    "MD5-SESS": _make_hash_utf8(hashlib.md5),
+    "SHA": _make_hash_utf8(hashlib.sha1),
+    "SHA-256": _make_hash_utf8(hashlib.sha256),
+    "SHA-512": _make_hash_utf8(hashlib.sha512),
+}
+
+
+@lru_cache(maxsize=32)
+def _split_qop(qop):
+    return frozenset(q.strip() for q in qop.split(","))
 
 
 def _basic_auth_str(username, password):
@@ -42,9 +67,7 @@ def _basic_auth_str(username, password):
         username = username.encode("latin1")
     if isinstance(password, str):
         password = password.encode("latin1")
-    authstr = "Basic " + to_native_string(
-        b64encode(b":".join((username, password))).strip()
-    )
+    authstr = "Basic " + b64encode(b":".join((username, password))).decode("ascii")
     return authstr
 
 
@@ -59,27 +82,35 @@ class HTTPBasicAuth(AuthBase):
     def __init__(self, username, password):
         self.username = username
         self.password = password
+        self._auth_str_cache = None
 
     def __eq__(self, other):
-        return all(
-            [
-                self.username == getattr(other, "username", None),
-                self.password == getattr(other, "password", None),
-            ]
-        )
+        return self.username == getattr(
+            other, "username", None
+        ) and self.password == getattr(other, "password", None)
 
     def __ne__(self, other):
         return not self == other
 
+    def _auth_str(self):
+        credentials = (self.username, self.password)
+        cache = getattr(self, "_auth_str_cache", None)
+        if cache is None or cache[0] != credentials:
+            cache = self._auth_str_cache = (
+                credentials,
+                _basic_auth_str(self.username, self.password),
+            )
+        return cache[1]
+
     def __call__(self, r):
-        r.headers["Authorization"] = _basic_auth_str(self.username, self.password)
+        r.headers["Authorization"] = self._auth_str()
         return r
 
 
 class HTTPProxyAuth(HTTPBasicAuth):
 
     def __call__(self, r):
-        r.headers["Proxy-Authorization"] = _basic_auth_str(self.username, self.password)
+        r.headers["Proxy-Authorization"] = self._auth_str()
         return r
 
 
@@ -91,58 +122,28 @@ class HTTPDigestAuth(AuthBase):
         self._thread_local = threading.local()
 
     def init_per_thread_state(self):
-        if not hasattr(self._thread_local, "init"):
-            self._thread_local.init = True
-            self._thread_local.last_nonce = ""
-            self._thread_local.nonce_count = 0
-            self._thread_local.chal = {}
-            self._thread_local.pos = None
-            self._thread_local.num_401_calls = None
+        state = self._thread_local
+        if not hasattr(state, "init"):
+            state.init = True
+            state.last_nonce = ""
+            state.nonce_count = 0
+            state.chal = {}
+            state.pos = None
+            state.num_401_calls = None
 
     def build_digest_header(self, method, url):
-        realm = self._thread_local.chal["realm"]
-        nonce = self._thread_local.chal["nonce"]
-        qop = self._thread_local.chal.get("qop")
-        algorithm = self._thread_local.chal.get("algorithm")
-        opaque = self._thread_local.chal.get("opaque")
-        hash_utf8 = None
+        state = self._thread_local
+        chal = state.chal
+        realm = chal["realm"]
+        nonce = chal["nonce"]
+        qop = chal.get("qop")
+        algorithm = chal.get("algorithm")
+        opaque = chal.get("opaque")
         if algorithm is None:
             _algorithm = "MD5"
         else:
             _algorithm = algorithm.upper()
-        if _algorithm == "MD5" or _algorithm == "MD5-SESS":
-
-            def md5_utf8(x):
-                if isinstance(x, str):
-                    x = x.encode("utf-8")
-                return hashlib.md5(x).hexdigest()
-
-            hash_utf8 = md5_utf8
-        elif _algorithm == "SHA":
-
-            def sha_utf8(x):
-                if isinstance(x, str):
-                    x = x.encode("utf-8")
-                return hashlib.sha1(x).hexdigest()
-
-            hash_utf8 = sha_utf8
-        elif _algorithm == "SHA-256":
-
-            def sha256_utf8(x):
-                if isinstance(x, str):
-                    x = x.encode("utf-8")
-                return hashlib.sha256(x).hexdigest()
-
-            hash_utf8 = sha256_utf8
-        elif _algorithm == "SHA-512":
-
-            def sha512_utf8(x):
-                if isinstance(x, str):
-                    x = x.encode("utf-8")
-                return hashlib.sha512(x).hexdigest()
-
-            hash_utf8 = sha512_utf8
-        KD = lambda s, d: hash_utf8(f"{s}:{d}")
+        hash_utf8 = _DIGEST_HASH_UTF8.get(_algorithm)
         if hash_utf8 is None:
             return None
         entdig = None
@@ -154,52 +155,56 @@ class HTTPDigestAuth(AuthBase):
         A2 = f"{method}:{path}"
         HA1 = hash_utf8(A1)
         HA2 = hash_utf8(A2)
-        if nonce == self._thread_local.last_nonce:
-            self._thread_local.nonce_count += 1
+        if nonce == state.last_nonce:
+            state.nonce_count += 1
         else:
-            self._thread_local.nonce_count = 1
-        ncvalue = f"{self._thread_local.nonce_count:08x}"
-        s = str(self._thread_local.nonce_count).encode("utf-8")
-        s += nonce.encode("utf-8")
-        s += time.ctime().encode("utf-8")
-        s += os.urandom(8)
-        cnonce = hashlib.sha1(s).hexdigest()[:16]
+            state.nonce_count = 1
+        ncvalue = f"{state.nonce_count:08x}"
+        cnonce = os.urandom(8).hex()
         if _algorithm == "MD5-SESS":
             HA1 = hash_utf8(f"{HA1}:{nonce}:{cnonce}")
         if not qop:
-            respdig = KD(HA1, f"{nonce}:{HA2}")
-        elif qop == "auth" or "auth" in qop.split(","):
+            respdig = hash_utf8(f"{HA1}:{nonce}:{HA2}")
+        elif "auth" in _split_qop(qop):
             noncebit = f"{nonce}:{ncvalue}:{cnonce}:auth:{HA2}"
-            respdig = KD(HA1, noncebit)
+            respdig = hash_utf8(f"{HA1}:{noncebit}")
         else:
             return None
-        self._thread_local.last_nonce = nonce
-        base = f'username="{self.username}", realm="{realm}", nonce="{nonce}", uri="{path}", response="{respdig}"'
+        state.last_nonce = nonce
+        parts = [
+            f'username="{self.username}"',
+            f'realm="{realm}"',
+            f'nonce="{nonce}"',
+            f'uri="{path}"',
+            f'response="{respdig}"',
+        ]
         if opaque:
-            base += f', opaque="{opaque}"'
+            parts.append(f'opaque="{opaque}"')
         if algorithm:
-            base += f', algorithm="{algorithm}"'
+            parts.append(f'algorithm="{algorithm}"')
         if entdig:
-            base += f', digest="{entdig}"'
+            parts.append(f'digest="{entdig}"')
         if qop:
-            base += f', qop="auth", nc={ncvalue}, cnonce="{cnonce}"'
-        return f"Digest {base}"
+            parts.append(f'qop="auth", nc={ncvalue}, cnonce="{cnonce}"')
+        return "Digest " + ", ".join(parts)
 
     def handle_redirect(self, r, **kwargs):
         if r.is_redirect:
             self._thread_local.num_401_calls = 1
 
     def handle_401(self, r, **kwargs):
+        state = self._thread_local
         if not 400 <= r.status_code < 500:
-            self._thread_local.num_401_calls = 1
+            state.num_401_calls = 1
             return r
-        if self._thread_local.pos is not None:
-            r.request.body.seek(self._thread_local.pos)
+        if state.pos is not None:
+            r.request.body.seek(state.pos)
         s_auth = r.headers.get("www-authenticate", "")
-        if "digest" in s_auth.lower() and self._thread_local.num_401_calls < 2:
-            self._thread_local.num_401_calls += 1
-            pat = re.compile("digest ", flags=re.IGNORECASE)
-            self._thread_local.chal = parse_dict_header(pat.sub("", s_auth, count=1))
+        if "digest" in s_auth.lower() and state.num_401_calls < 2:
+            state.num_401_calls += 1
+            state.chal = parse_dict_header(
+                _DIGEST_PREFIX_RE.sub("", s_auth, count=1)
+            )
             r.content
             r.close()
             prep = r.request.copy()
@@ -212,29 +217,27 @@ class HTTPDigestAuth(AuthBase):
             _r.history.append(r)
             _r.request = prep
             return _r
-        self._thread_local.num_401_calls = 1
+        state.num_401_calls = 1
         return r
 
     def __call__(self, r):
         self.init_per_thread_state()
-        if self._thread_local.last_nonce:
+        state = self._thread_local
+        if state.last_nonce:
             r.headers["Authorization"] = self.build_digest_header(r.method, r.url)
         try:
-            self._thread_local.pos = r.body.tell()
+            state.pos = r.body.tell()
         except AttributeError:
-            self._thread_local.pos = None
+            state.pos = None
         r.register_hook("response", self.handle_401)
         r.register_hook("response", self.handle_redirect)
-        self._thread_local.num_401_calls = 1
+        state.num_401_calls = 1
         return r
 
     def __eq__(self, other):
-        return all(
-            [
-                self.username == getattr(other, "username", None),
-                self.password == getattr(other, "password", None),
-            ]
-        )
+        return self.username == getattr(
+            other, "username", None
+        ) and self.password == getattr(other, "password", None)
 
     def __ne__(self, other):
         return not self == other
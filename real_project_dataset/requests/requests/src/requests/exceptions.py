@@ -11,14 +11,16 @@ from .compat import JSONDecodeError as CompatJSONDecodeError
 
 class RequestException(IOError):
 
-    def __init__(self, *args, **kwargs):
-        response = kwargs.pop("response", None)
-        self.response = response
-        self.request = kwargs.pop("request", None)
-        if response is not None and not self.request and hasattr(response, "request"):
-            self.request = self.response.request
+    def __init__(self, *args, response=None, request=None, **kwargs):
+        self._set_response_and_request(response, request)
         super().__init__(*args, **kwargs)
 
+    def _set_response_and_request(self, response, request):
+        self.response = response
+        if response is not None and not request:
+            request = getattr(response, "request", request)
+        self.request = request
+
 
 class InvalidJSONError(RequestException):
     pass
@@ -26,9 +28,9 @@ class InvalidJSONError(RequestException):
 
 class JSONDecodeError(InvalidJSONError, CompatJSONDecodeError):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, response=None, request=None):
         CompatJSONDecodeError.__init__(self, *args)
-        InvalidJSONError.__init__(self, *self.args, **kwargs)
+        self._set_response_and_request(response, request)
 
     def __reduce__(self):
         return CompatJSONDecodeError.__reduce__(self)
@@ -1,16 +1,22 @@
 import sys
 from .compat import chardet
 
-for package in ("urllib3", "idna"):
-    locals()[package] = __import__(package)
-    for mod in list(sys.modules):
-        if mod == package or mod.startswith(f"{package}."):
-            sys.modules[f"requests.packages.{mod}"] = sys.modules[mod]
-if chardet is not None:
-    target = chardet.__name__
+
+def _alias_vendored_modules():
+    aliases = {}
+    for package in ("urllib3", "idna"):
+        globals()[package] = __import__(package)
+        aliases[package] = (package,)
+    if chardet is not None:
+        target = chardet.__name__
+        aliases[target] = (target, "chardet")
     for mod in list(sys.modules):
-        if mod == target or mod.startswith(f"{target}."):
+        names = aliases.get(mod.partition(".")[0])
+        if names is not None:
             imported_mod = sys.modules[mod]
-            sys.modules[f"requests.packages.{mod}"] = imported_mod
-            mod = mod.replace(target, "chardet")
-            sys.modules[f"requests.packages.{mod}"] = imported_mod
+            suffix = mod[len(names[0]) :]
+            for name in names:
+                sys.modules[f"requests.packages.{name}{suffix}"] = imported_mod
+
+
+_alias_vendored_modules()
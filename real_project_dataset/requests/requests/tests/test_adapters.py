@@ -5,3 +5,18 @@ def test_request_url_trims_leading_path_separators():
     a = requests.adapters.HTTPAdapter()
     p = requests.Request(method="GET", url="http://127.0.0.1:10000//v:h").prepare()
     assert "/v:h" == a.request_url(p, {})
+
+
+def test_request_url_uses_absolute_url_for_http_proxy():
+    a = requests.adapters.HTTPAdapter()
+    p = requests.Request(method="GET", url="http://example.com/a?b=c").prepare()
+    proxies = {"http": "HTTP://proxy.example.com:3128"}
+    assert "http://example.com/a?b=c" == a.request_url(p, proxies)
+
+
+def test_request_url_uses_path_for_https_and_socks_proxies():
+    a = requests.adapters.HTTPAdapter()
+    p = requests.Request(method="GET", url="https://example.com/a?b=c").prepare()
+    assert "/a?b=c" == a.request_url(p, {"https": "http://proxy.example.com:3128"})
+    p = requests.Request(method="GET", url="http://example.com/a?b=c").prepare()
+    assert "/a?b=c" == a.request_url(p, {"http": "socks5h://proxy.example.com:1080"})
@@ -39,3 +39,5 @@ m = Map(
         ),
     ]
 )
+
+m.update()
@@ -1,8 +1,13 @@
 """Does the synchronization. Called by "manage-plnt.py sync"."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from urllib.parse import urlsplit
 import feedparser
 from markupsafe import escape
+import requests
+from requests.adapters import HTTPAdapter
 from .database import Blog
 from .database import Entry
 from .database import session
@@ -10,16 +15,50 @@ from .utils import nl2p
 from .utils import strip_tags
 
 HTML_MIMETYPES = {"text/html", "application/xhtml+xml"}
+FEED_FETCH_WORKERS = 16
+FEED_FETCH_TIMEOUT = 30
+HTTP_SCHEMES = {"http", "https"}
+
+
+def new_http_session():
+    http_session = requests.Session()
+    http_session.mount("http://", HTTPAdapter(pool_maxsize=FEED_FETCH_WORKERS))
+    http_session.mount("https://", HTTPAdapter(pool_maxsize=FEED_FETCH_WORKERS))
+    return http_session
+
+
+def fetch_feed(http_session, url):
+    if urlsplit(url).scheme not in HTTP_SCHEMES:
+        return feedparser.parse(url)
+    try:
+        response = http_session.get(url, timeout=FEED_FETCH_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        return feedparser.FeedParserDict(entries=[], bozo=1, bozo_exception=e)
+    headers = {k.lower(): v for k, v in response.headers.items()}
+    headers.pop("content-encoding", None)
+    headers.setdefault("content-location", response.url)
+    return feedparser.parse(response.content, response_headers=headers)
 
 
 def sync():
-    for blog in Blog.query.all():
-        feed = feedparser.parse(blog.feed_url)
+    known_entries = {}
+    blogs = Blog.query.all()
+    with new_http_session() as http_session:
+        fetch = partial(fetch_feed, http_session)
+        with ThreadPoolExecutor(max_workers=FEED_FETCH_WORKERS) as executor:
+            feeds = list(executor.map(fetch, [b.feed_url for b in blogs]))
+    for blog, feed in zip(blogs, feeds):
+        guids = {entry.get("id") or entry.get("link") for entry in feed.entries}
+        missing = [guid for guid in guids if guid and guid not in known_entries]
+        if missing:
+            for old_entry in Entry.query.filter(Entry.guid.in_(missing)):
+                known_entries[old_entry.guid] = old_entry
         for entry in feed.entries:
             guid = entry.get("id") or entry.get("link")
             if not guid:
                 continue
-            old_entry = Entry.query.filter_by(guid=guid).first()
+            old_entry = known_entries.get(guid)
             if "title_detail" in entry:
                 title = entry.title_detail.get("value") or ""
                 if entry.title_detail.get("type") in HTML_MIMETYPES:
@@ -62,4 +101,5 @@ def sync():
             entry.pub_date = pub_date
             entry.last_update = updated
             session.add(entry)
+            known_entries[guid] = entry
     session.commit()
@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from html import unescape
 from os import path
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
@@ -19,13 +21,7 @@ jinja_env = Environment(loader=FileSystemLoader(template_path))
 url_map = Map([Rule("/shared/<path:file>", endpoint="shared")])
 endpoints = {}
 _par_re = re.compile("\\n{2,}")
-_entity_re = re.compile("&([^;]+);")
 _striptags_re = re.compile("(<!--.*-->|<[^>]*>)")
-from html.entities import name2codepoint
-
-html_entities = name2codepoint.copy()
-html_entities["apos"] = 39
-del name2codepoint
 
 
 def expose(url_rule, endpoint=None, **kwargs):
@@ -39,14 +35,19 @@ def expose(url_rule, endpoint=None, **kwargs):
     return decorate
 
 
+@lru_cache(maxsize=256)
+def get_template(template_name):
+    return jinja_env.get_template(template_name)
+
+
 def render_template(template_name, **context):
-    tmpl = jinja_env.get_template(template_name)
+    tmpl = get_template(template_name)
     context["url_for"] = url_for
     return Response(tmpl.render(context), mimetype="text/html")
 
 
 def nl2p(s):
-    return "\n".join(f"<p>{p}</p>" for p in _par_re.split(s))
+    return "<p>" + _par_re.sub("</p>\n<p>", s) + "</p>"
 
 
 def url_for(endpoint, **kw):
@@ -54,24 +55,7 @@ def url_for(endpoint, **kw):
 
 
 def strip_tags(s):
-
-    def handle_match(m):
-        name = m.group(1)
-        if name in html_entities:
-            return chr(html_entities[name])
-        if name[:2] in ("#x", "#X"):
-            try:
-                return chr(int(name[2:], 16))
-            except ValueError:
-                return ""
-        elif name.startswith("#"):
-            try:
-                return chr(int(name[1:]))
-            except ValueError:
-                return ""
-        return ""
-
-    return _entity_re.sub(handle_match, _striptags_re.sub("", s))
+    return unescape(_striptags_re.sub("", s))
 
 
 class Pagination:
@@ -94,11 +78,11 @@ class Pagination:
     def count(self):
         return self.query.count()
 
-    @property
+    @cached_property
     def has_previous(self):
         return self.page > 1
 
-    @property
+    @cached_property
     def has_next(self):
         return self.page < self.pages
 
@@ -110,6 +94,6 @@ class Pagination:
     def next(self):
         return url_for(self.endpoint, page=self.page + 1)
 
-    @property
+    @cached_property
     def pages(self):
         return max(0, self.count - 1) // self.per_page + 1
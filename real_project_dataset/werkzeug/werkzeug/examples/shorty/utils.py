@@ -1,6 +1,7 @@
+from functools import lru_cache
 from os import path
+from os import urandom
 from random import randrange
-from random import sample
 from urllib.parse import urlsplit
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
@@ -18,6 +19,8 @@ TEMPLATE_PATH = path.join(path.dirname(__file__), "templates")
 STATIC_PATH = path.join(path.dirname(__file__), "static")
 ALLOWED_SCHEMES = frozenset(["http", "https", "ftp", "ftps"])
 URL_CHARS = "abcdefghijkmpqrstuvwxyzABCDEFGHIJKLMNPQRST23456789"
+_URL_CHARS_TABLE = (URL_CHARS * (256 // len(URL_CHARS) + 1))[:256].encode("ascii")
+_URL_CHARS_REJECT = bytes(range(256 // len(URL_CHARS) * len(URL_CHARS), 256))
 local = Local()
 local_manager = LocalManager([local])
 application = local("application")
@@ -48,10 +51,13 @@ def url_for(endpoint, _external=False, **values):
 jinja_env.globals["url_for"] = url_for
 
 
+@lru_cache(maxsize=256)
+def get_template(template):
+    return jinja_env.get_template(template)
+
+
 def render_template(template, **context):
-    return Response(
-        jinja_env.get_template(template).render(**context), mimetype="text/html"
-    )
+    return Response(get_template(template).render(**context), mimetype="text/html")
 
 
 def validate_url(url):
@@ -59,7 +65,11 @@ def validate_url(url):
 
 
 def get_random_uid():
-    return "".join(sample(URL_CHARS, randrange(3, 9)))
+    length = randrange(3, 9)
+    while True:
+        uid = urandom(length * 2).translate(_URL_CHARS_TABLE, _URL_CHARS_REJECT)
+        if len(uid) >= length:
+            return uid[:length].decode("ascii")
 
 
 class Pagination:
@@ -82,11 +92,11 @@ class Pagination:
             .all()
         )
 
-    @property
+    @cached_property
     def has_previous(self):
         return self.page > 1
 
-    @property
+    @cached_property
     def has_next(self):
         return self.page < self.pages
 
@@ -98,6 +108,6 @@ class Pagination:
     def next(self):
         return url_for(self.endpoint, page=self.page + 1)
 
-    @property
+    @cached_property
     def pages(self):
         return max(0, self.count - 1) // self.per_page + 1
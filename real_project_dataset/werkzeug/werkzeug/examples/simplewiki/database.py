@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from datetime import datetime
 from sqlalchemy import Column
 from sqlalchemy import DateTime
@@ -14,10 +15,6 @@ from sqlalchemy.orm import scoped_session
 from .utils import application
 from .utils import parse_creole
 
-try:
-    from greenlet import getcurrent as get_ident
-except ImportError:
-    from threading import get_ident
 metadata = MetaData()
 
 
@@ -25,7 +22,18 @@ def new_db_session():
     return create_session(application.database_engine, autoflush=True, autocommit=False)
 
 
-session = scoped_session(new_db_session, get_ident)
+session_scope = ContextVar("simplewiki_session_scope")
+
+
+def get_session_scope():
+    scope = session_scope.get(None)
+    if scope is None:
+        scope = object()
+        session_scope.set(scope)
+    return scope
+
+
+session = scoped_session(new_db_session, scopefunc=get_session_scope)
 page_table = Table(
     "pages",
     metadata,